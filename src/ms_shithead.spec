@@ -8,7 +8,7 @@ a = Analysis(
     ['shithead_start.py'],
     pathex=[],
     binaries=[],
-    datas=[('./shithead/title.json','shithead'), ('./shithead/rules.py','shithead'), ('./shithead/face_up_table.json', 'shithead'), ('./shithead/ms_rules_eng.json', 'shithead'), ('./shithead/ms_rules_ger.json', 'shithead')],
+    datas=[('./shithead/title.bin','shithead'), ('./shithead/rules.py','shithead'), ('./shithead/face_up_table.json', 'shithead'), ('./shithead/ms_rules_eng.json', 'shithead'), ('./shithead/ms_rules_ger.json', 'shithead')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
@@ -5,7 +5,7 @@ a = Analysis(
     ['shithead_start.py'],
     pathex=[],
     binaries=[],
-    datas=[('./shithead/title.json','shithead'),\
+    datas=[('./shithead/title.bin','shithead'),\
 	       ('./shithead/rules.py','shithead'),\
 		   ('./shithead/face_up_table.json', 'shithead'),\
 		   ('./shithead/rules_eng.json', 'shithead'),\
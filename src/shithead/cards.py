@@ -402,8 +402,7 @@ class Deck:
         :rtype:             Deck
         '''
         new_deck = Deck(empty=True)     # did is doesn't matter for empty Deck
-        for card in self.deck:
-            new_deck.add_card(card.copy())
+        new_deck.deck = [card.copy() for card in self.deck]
 
         return new_deck
 
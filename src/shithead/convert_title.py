@@ -0,0 +1,55 @@
+"""
+Convert title coords from json to binary file.
+
+The card writer tool (-> card_writer.py) saves position and angle of the cards
+forming the 'SHITHEAD' title as list of (x, y, angle) in a json file.
+The start screen loads these coords from a binary file with 3 little-endian
+float32 values per card, which can be read directly into a numpy array without
+parsing.
+Run this after changing the title with the card writer:
+
+    python -m shithead.convert_title title.json title.bin
+
+17.10.2026  agent
+"""
+
+import argparse
+import json
+
+import numpy as np
+
+# data type of the values in the binary title file
+TITLE_DTYPE = '<f4'
+
+
+def convert_title(json_file, bin_file):
+    '''
+    Convert json file with title coords to binary file.
+
+    :param json_file:   name of json file with list of (x, y, angle).
+    :type json_file:    str
+    :param bin_file:    name of binary file.
+    :type bin_file:     str
+    :return:            number of cards in title.
+    :rtype:             int
+    '''
+    with open(json_file, 'r', encoding='utf-8') as in_file:
+        title_coords = json.load(in_file)
+    coords = np.asarray(title_coords, dtype=TITLE_DTYPE).reshape(-1, 3)
+    coords.tofile(bin_file)
+    return len(coords)
+
+
+def main():
+    """ Main function """
+    parser = argparse.ArgumentParser(prog='convert_title')
+    parser.add_argument('json_file', nargs='?', default='title.json')
+    parser.add_argument('bin_file', nargs='?', default='title.bin')
+    args = parser.parse_args()
+
+    n_cards = convert_title(args.json_file, args.bin_file)
+    print(f'{n_cards} cards written to {args.bin_file}')
+
+
+if __name__ == "__main__":
+    main()
@@ -44,6 +44,12 @@ ACCEPT_TABLE = [
     ['2', '3', '10', 'A'],                                               # 'A'
 ]
 
+# ACCEPT_TABLE as sets for fast membership tests
+ACCEPT_SETS = [frozenset(ranks) for ranks in ACCEPT_TABLE]
+
+# every regular card rank can be played on an empty discard pile
+ALL_RANKS = frozenset(CARD_RANKS)
+
 
 # ----------------------------------------------------------------------------
 class Discard(Deck):
@@ -64,8 +70,104 @@ class Discard(Deck):
         '''
         Create an empty discard pile.
         '''
-        super().__init__()
-        self.deck = []
+        super().__init__(empty=True)
+        # number of cards with same rank at the top and top non-3 rank
+        # (-> get_top_info()), None => pile changed since last evaluation.
+        self.top_info = None
+
+    def add_card(self, card):
+        '''
+        Add a card to the top of the discard pile.
+
+        :param card:    card added to discard pile.
+        :type card:     Card.
+        '''
+        self.deck.append(card)
+        self.top_info = None    # top of pile changed
+
+    def pop_card(self, index=None):
+        '''
+        Remove card at index from discard pile and return it.
+
+        If index was not specified remove the top card.
+
+        :param index:   index of card we want to remove.
+        :type index:    int
+        :return:        card from discard pile at index or top card.
+        :rtype:         Card
+        '''
+        self.top_info = None    # top of pile changes
+        return super().pop_card(index)
+
+    def remove_card(self, card):
+        '''
+        Remove the specified card from the discard pile.
+
+        :param card:    selected card.
+        :type card:     Card
+        :return:        the 1st card in the pile which matches suit/rank/did,
+                        or None.
+        :rtype:         Card
+        '''
+        self.top_info = None    # top of pile may change
+        return super().remove_card(card)
+
+    def __setitem__(self, index, card):
+        '''
+        Replace card at index in the discard pile.
+
+        :param index:   index of replaced card.
+        :type index:    int
+        :param card:    new card.
+        :type card:     Card
+        '''
+        super().__setitem__(index, card)
+        self.top_info = None    # top of pile may change
+
+    def load_from_state(self, state, reset=True):
+        '''
+        Loads discard pile from state.
+
+        :param state:   list with all cards (states) in the discard pile.
+        :type state:    list
+        :param reset:   reset discard pile before loading cards.
+        :type reset:    bool
+        '''
+        super().load_from_state(state, reset)
+        self.top_info = None    # pile changed
+
+    def get_top_info(self):
+        '''
+        Get number of cards with same rank at top and rank of top non-3 card.
+
+        Both values are evaluated together and cached until the discard pile
+        is changed with add_card(), pop_card(), remove_card(), '[]', or
+        load_from_state(). Note, that the card list (deck) must not be changed
+        directly.
+
+        :return:    number of top cards, top non-3 rank (None => only '3's).
+        :rtype:     tuple
+        '''
+        if self.top_info is not None:
+            return self.top_info
+        if len(self.deck) == 0:
+            self.top_info = (0, None)
+        else:
+            top_rank = self.deck[-1].rank
+            ntop = 0
+            # count cards with same rank at the top
+            for card in reversed(self.deck):
+                if card.rank != top_rank:
+                    break  # 1st different rank below top
+                ntop += 1
+            non3 = None
+            # find 1st card from the top which is not a '3'
+            for card in reversed(self.deck):
+                if card.rank != '3':
+                    non3 = card.rank
+                    break
+            self.top_info = (ntop, non3)
+        return self.top_info
 
     def get_top_rank(self):
         '''
@@ -86,12 +188,7 @@ class Discard(Deck):
         :return: rank of 1st non-3 card, None => pile empty or only '3's
         :rtype: str
         '''
-        for card in self.deck[::-1]:
-            # go through discard pile in reversedorder.
-            if card.rank != '3':
-                return card.rank
-        # if we get here => only '3' or empty discard pile
-        return None
+        return self.get_top_info()[1]
 
     def get_ntop(self):
         '''
@@ -100,16 +197,7 @@ class Discard(Deck):
         :return: number of cards with same rank at top of discard pile.
         :rtype: int
         '''
-        ntop = 0
-        top_rank = self.get_top_rank()
-        # count cards with same rank at the top
-        for card in self.deck[::-1]:
-            # go through discard pile in reversed order.
-            if card.rank == top_rank:
-                ntop += 1   # same rank => increment count
-            else:
-                break  # 1st different rank below top
-        return ntop
+        return self.get_top_info()[0]
 
     def get_ntop_visible(self):
         '''
@@ -185,8 +273,8 @@ class Discard(Deck):
         :rtype:             Discard
         '''
         new_discard = Discard()
-        for card in self.deck:
-            new_discard.add_card(card.copy())
+        new_discard.deck = [card.copy() for card in self.deck]
+        new_discard.top_info = self.top_info    # same cards at the top
         return new_discard
 
     def check(self, first, card):
@@ -200,15 +288,28 @@ class Discard(Deck):
         :return:        True => can be played, False => cannot be played.
         :rtype:         bool
         '''
+        return card.rank in self.get_playable_ranks(first)
+
+    def get_playable_ranks(self, first):
+        '''
+        Get the set of ranks which can be played on the discard pile.
+
+        Checking a list of cards against this set is much faster than calling
+        check() for each card, because the top of the discard pile is only
+        evaluated once.
+
+        :param first:   True => player first play this turn.
+        :type first:    bool
+        :return:        playable ranks.
+        :rtype:         frozenset
+        '''
         # We can create dummy cards with a rank outside the usual ranks
-        # => can never be played on the discard pile
-        if card.rank not in CARD_RANKS:
-            return False
+        # => never in one of the sets, i.e. can never be played.
 
         # pile is empty => any card can be played
         #                  (also if it's not the 1st card this turn).
         if len(self.deck) == 0:
-            return True
+            return ALL_RANKS
 
         # pile is not empty and it's player's 1st card this turn
         if first:
@@ -216,13 +317,9 @@ class Discard(Deck):
             ref = self.get_top_non3_rank()
             if ref is None:
                 # only '3's in discard pile => any card can be played
-                return True
-            # check if the specified card can be played on the reference rank
-            ref_idx = CARD_RANKS.index(ref)
-            if card.rank in ACCEPT_TABLE[ref_idx]:
-                return True
-            else:
-                return False
+                return ALL_RANKS
+            # ranks which can be played on the reference rank
+            return ACCEPT_SETS[CARD_RANKS.index(ref)]
         # pile is not empty and player has already played card(s) this turn
         # => card may be played if a 'Q' is at the top (but only less than 4
         #    'Q', otherwise we had to kill the discard pile first!) or if it
@@ -232,12 +329,9 @@ class Discard(Deck):
             if top == 'Q' and self.get_ntop() < 4:
                 # any card can be played on 1 - 3 'Q's, but only another 'Q'
                 # on 4 or more 'Q's
-                return True
-            elif card.rank == top:
-                # card with same rank as top card can be played.
-                return True
-            else:
-                return False
+                return ALL_RANKS
+            # card with same rank as top card can be played.
+            return frozenset((top,)) & ALL_RANKS
 
 
 def test_discard_pile():
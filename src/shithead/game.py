@@ -17,7 +17,7 @@ from random import randint
 # local imports (modules in same package)
 from .cards import Card
 from .state import State, SWAPPING_CARDS, FIND_STARTER, PLAY_GAME
-from .state import SHITHEAD_FOUND, ABORTED
+from .state import SHITHEAD_FOUND, ABORTED, get_next_indices
 from .discard import Discard
 
 # uncomment this import if you want to run initial_tests()
@@ -169,26 +169,23 @@ class Game:
         else:
             direction = state.direction
 
+        # get lookup table for next player in game direction.
+        clockwise, counterclockwise = get_next_indices(len(state.players))
+        if direction:
+            step = clockwise
+        else:
+            step = counterclockwise
+
         # find next player in game direction.
         player = state.player
-        n_players = len(state.players)
-        if direction:   # clockwise
-            next_player = (player + 1) % n_players
-        else:           # counterclockwise
-            next_player = (player + n_players - 1) % n_players
+        next_player = step[player]
 
         # skip over players according to the number of '8's played this turn
         for _ in range(state.eights):
-            if direction:   # clockwise
-                next_player = (next_player + 1) % n_players
-                # don't count current player if he's already out
-                if next_player == player and out:
-                    next_player = (next_player + 1) % n_players
-            else:   # counterclockwise
-                next_player = (next_player + n_players - 1) % n_players
-                # don't count current player if he's already out
-                if next_player == player and out:
-                    next_player = (next_player + n_players - 1) % n_players
+            next_player = step[next_player]
+            # don't count current player if he's already out
+            if next_player == player and out:
+                next_player = step[next_player]
         return (direction, next_player)
 
     @classmethod
@@ -617,8 +614,9 @@ class Game:
         else:
             next_state.log_card = ''
 
-        # add this play to the play history of the next state
-        next_state.history.append(str(play))
+        # add this play (encoded as int) to the play history of the next
+        # state
+        next_state.record(play.encode())
 
         return next_state
 
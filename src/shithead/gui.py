@@ -197,7 +197,7 @@ from .stats import Statistics
 from .game import Game
 from .state import (State, SWAPPING_CARDS, FIND_STARTER, PLAY_GAME,
                     SHITHEAD_FOUND, ABORTED)
-from .state import STARTING_SUITS, STARTING_RANKS
+from .state import STARTING_CODE
 from .play import Play
 from . import result
 
@@ -212,6 +212,9 @@ SCREEN_TITLE = "Sh*thead"
 FACE_DOWN_IMAGE = [':resources:images/cards/cardBack_red2.png',
                    ':resources:images/cards/cardBack_blue2.png']
 
+# textures of card images shared by all card sprites (image => texture)
+CARD_TEXTURES = {}
+
 # Card size
 CARD_SCALE = 0.5
 CARD_WIDTH = int(140 * CARD_SCALE)
@@ -415,6 +418,26 @@ TIPS_EN = {
 }
 
 
+# -----------------------------------------------------------------------------
+def load_card_texture(image):
+    '''
+    Get the texture of a card image.
+
+    Each card image is loaded only once (without hit box calculation) and the
+    texture is then shared by all card sprites using this image.
+
+    :param image:   name of card image (face up or face down).
+    :type image:    str
+    :return:        texture of this card image.
+    :rtype:         arcade.Texture
+    '''
+    texture = CARD_TEXTURES.get(image)
+    if texture is None:
+        texture = arcade.load_texture(image, hit_box_algorithm='None')
+        CARD_TEXTURES[image] = texture
+    return texture
+
+
 # -----------------------------------------------------------------------------
 class CardSprite(arcade.Sprite):
     '''
@@ -444,8 +467,9 @@ class CardSprite(arcade.Sprite):
 
         # call the super class (arcade.Sprite) initializer
         # cards are initially rendered face down
-        super().__init__(FACE_DOWN_IMAGE[self.card.did % 2], scale,
-                         hit_box_algorithm='None')
+        super().__init__(
+            scale=scale, hit_box_algorithm='None',
+            texture=load_card_texture(FACE_DOWN_IMAGE[self.card.did % 2]))
 
     def face_down(self):
         """
@@ -456,7 +480,7 @@ class CardSprite(arcade.Sprite):
         odd id have blue backs.
         """
         # load the face down image into the sprite
-        self.texture = arcade.load_texture(FACE_DOWN_IMAGE[self.card.did % 2])
+        self.texture = load_card_texture(FACE_DOWN_IMAGE[self.card.did % 2])
         # reset the face up flag
         self.card.is_face_up = False
 
@@ -465,7 +489,7 @@ class CardSprite(arcade.Sprite):
         Turn the card face up.
         """
         # load the face up image into the sprite
-        self.texture = arcade.load_texture(self.image)
+        self.texture = load_card_texture(self.image)
         # set the face up flag
         self.card.is_face_up = True
 
@@ -2487,8 +2511,7 @@ class GameView(arcade.View):
 
         elif phase == FIND_STARTER:
             # player didn't show starting card
-            suit = STARTING_SUITS[self.state.starting_card % 4]
-            rank = STARTING_RANKS[self.state.starting_card // 4]
+            suit, rank = STARTING_CODE[self.state.starting_card]
             card = Card(0, suit, rank)
             # don't stop if player couldn't show starter card, just wait 1s
             self.set_message('DOES_NOT_SHOW', 0, player.name, '', card)
@@ -2929,8 +2952,7 @@ class GameView(arcade.View):
             # check if human player can show the starter card
             if len(self.state.get_legal_plays()) > 1:
                 # instruction for human player
-                suit = STARTING_SUITS[self.state.starting_card % 4]
-                rank = STARTING_RANKS[self.state.starting_card // 4]
+                suit, rank = STARTING_CODE[self.state.starting_card]
                 card = Card(0, suit, rank)
                 self.set_message('SHOW_OR_SKIP', 0, player.name, '', card)
                 # human player decides interactively
@@ -39,7 +39,7 @@ class MonteCarlo:
         self.game = game
         self.ucb1_explore_param = ucb1_explore_param
         # dictionary mapping State.hash() to MonteCarloNode
-        # => a node is unambiguously identified by the play history leading up
+        # => a node is identified by the hash of the play history leading up
         #    to its state.
         self.nodes = {}
 
@@ -55,14 +55,14 @@ class MonteCarlo:
         Create dangling node.
 
         If the specified state does not exist (i.e. there's no key
-        corresponding to its play history in the nodes dictionary yet),
-        We create a new root node (no parent) and add it to nodes.
+        corresponding to the hash of its play history in the nodes dictionary
+        yet), We create a new root node (no parent) and add it to nodes.
         !!!Note!!!
-        Each state uses its whole play history as hash key, i.e. that usually
-        only the very 1st node is a dangling node. If run_search() is called
-        again at a later time, there should already be a node with this hash
-        in the existing tree and run_search() just adds more nodes to this tree
-        below the specified node.
+        Each state uses the hash of its whole play history as key (->
+        State.hash()), i.e. that usually only the very 1st node is a dangling
+        node. If run_search() is called again at a later time, there should
+        already be a node with this hash in the existing tree and run_search()
+        just adds more nodes to this tree below the specified node.
 
         :param state:   Shithead game state.
         :type state:    State
@@ -93,7 +93,7 @@ class MonteCarlo:
         :param verbose:     True => print details of found node.
         :type verbose:      bool
         '''
-        # get the node belonging to this state (play history)
+        # get the node belonging to this state (hash of play history)
         node = self.nodes[state.hash()]
         # search through tree to find a not fully expanded or leaf node.
         while node.is_fully_expanded() and not node.is_leaf():
@@ -290,7 +290,7 @@ class MonteCarlo:
         '''
         # If this is the the 1st call of run_search() we create the root node
         # of the search tree for the initial state.
-        # Later calls will use the hash (play history) of the state to find the
+        # Later calls will use the hash of the state's play history to find the
         # corresponding node in the existing tree and expand the existing tree
         # below the found node.
         self.make_node(state)
@@ -397,17 +397,17 @@ class MonteCarlo:
         '''
         # create the root node of the search tree for this state
         # but only if there's not already an entry in dictionary self.nodes for
-        # this state's play history.
+        # the hash of this state's play history.
         # if a new root node is generated we will get an error next then
         # checking if it's fully expanded!
         self.make_node(state)
 
-        # check if all possible plays for the root node identified by this
-        # state's play history have been expanded.
+        # check if all possible plays for the root node identified by the
+        # hash of this state's play history have been expanded.
         if not self.nodes[state.hash()].is_fully_expanded():
             raise ValueError('Not enough information!')
 
-        # get the root node identified by this state's play history.
+        # get the root node identified by the hash of the play history.
         node = self.nodes[state.hash()]
         # initialize best play
         best_play = None
@@ -440,9 +440,9 @@ class MonteCarlo:
         Return MCTS statistics this state.
 
         Returns the number of plays and the number of wins for the node
-        identified by the play history of this state and a list with the number
-        of plays and wins for each of its children, plus the total over all
-        children.
+        identified by the hash of this state's play history and a list with
+        the number of plays and wins for each of its children, plus the total
+        over all children.
 
         :param state: game state identifying node for which we want the stats.
         :type state: State
@@ -710,7 +710,7 @@ def run_first_step(filename):
     # create the root node in the MonteCarlo tree from this end game state.
     print('\n### Root node ###')
     mcts.make_node(state)
-    mcts.nodes[''].print()
+    mcts.nodes[state.hash()].print()
 
     # get the start node of the search (= root node)
     start_node = mcts.nodes[state.hash()]
@@ -812,9 +812,10 @@ def play_end_game_with_open_cards(filename, timeout=3.0, policy='robust'):
     search tree for the whole end game.
     We start with the root node (dangling node with no parent).
     From there each following game state should already have a node in the
-    search tree identified by the play history. Therefore, the search tree
-    grows with every turn unless, the selected node cannont be expanded,
-    because in its state the shithread has already been found.
+    search tree identified by the hash of its play history (-> State.hash()).
+    Therefore, the search tree grows with every turn unless, the selected node
+    cannont be expanded, because in its state the shithread has already been
+    found.
 
     :param filename:    name of json-file containing end game state.
     :type filename:     str
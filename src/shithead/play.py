@@ -45,11 +45,18 @@ ACTIONS = (
     'DEALER',   # change the shuffling (for AI evaluation round)
 )
 
+# action => action code (index in ACTIONS) used to encode plays as int.
+ACTION_CODES = {action: code for code, action in enumerate(ACTIONS)}
+
 
 class Play:
     """
     class representing a possible shithead play.
     """
+    # plays are created in large numbers by the legal play generation
+    # => no instance dictionary (faster to create, less memory).
+    __slots__ = ('action', 'index')
+
     def __init__(self, action, index=-1):
         '''
         Initializer of Play class.
@@ -85,3 +92,40 @@ class Play:
         state['action'] = self.action
         state['index'] = self.index
         return state
+
+    def encode(self):
+        '''
+        Encode play as integer (e.g. for the play history of a game state).
+
+        The action code is stored in the lower part and the index (+1, since
+        it's -1 for plays not using a card) in the upper part of the integer.
+
+        :return:        integer code of this play.
+        :rtype:         int
+        '''
+        return ACTION_CODES[self.action] + len(ACTIONS) * (self.index + 1)
+
+    @classmethod
+    def decode(cls, code):
+        '''
+        Create play from integer code (-> encode()).
+
+        :param code:    integer code of play.
+        :type code:     int
+        :return:        decoded play.
+        :rtype:         Play
+        '''
+        return Play(ACTIONS[code % len(ACTIONS)], code // len(ACTIONS) - 1)
+
+    @classmethod
+    def from_string(cls, play_str):
+        '''
+        Create play from its string representation (-> __str__()).
+
+        :param play_str:    play as string 'action:index'.
+        :type play_str:     str
+        :return:            play.
+        :rtype:             Play
+        '''
+        action, index = play_str.split(':')
+        return Play(action, int(index))
@@ -125,6 +125,7 @@ class Player:
         self.get_fup = False    # True => take face up table card as 2nd play
         self.get_fup_rank = None  # rank of face up table card taken on hand
         self.is_human = False   # True => human player
+        self.is_ai = False      # True => AI player
         self.fup_table = None       # human player never uses FUP table.
 
     def select_swap(self, plays):
@@ -241,16 +242,18 @@ class Player:
         If all hand cards are gone, he must play from the face up cards.
         If all face up cards are also gone, he must play his face down cards.
         If all face down cards are gone, this player is out of the game.
+        Note, that the card list is not copied (this is called for every
+        legal play query), i.e. the caller must not change it.
 
         :return: action used to create Play object plus card list.
         :rtype: (action, list)
         '''
-        if len(self.hand) > 0:
-            return ('HAND', [card for card in self.hand])
-        elif len(self.face_up) > 0:
-            return ('FUP', [card for card in self.face_up])
-        elif len(self.face_down) > 0:
-            return ('FDOWN', [card for card in self.face_down])
+        if self.hand.deck:
+            return ('HAND', self.hand.deck)
+        elif self.face_up.deck:
+            return ('FUP', self.face_up.deck)
+        elif self.face_down.deck:
+            return ('FDOWN', self.face_down.deck)
         else:
             return ('OUT', [])
 
@@ -730,11 +733,24 @@ class Player:
         '''
         Creates a copy of itself.
 
+        Instead of creating a new player with its constructor (i.e. with
+        empty decks which are replaced right away), all attributes are copied
+        to a bare player object of the same class. Only the cards have to be
+        copied (not just referenced), sub-classes take care of their own
+        mutable attributes.
+
         :return:        copy of this player (not just reference).
         :rtype:         Player
         '''
-        raise NotImplementedError("This method must be implemented in the"
-                                  " subclass")
+        new_player = self.__class__.__new__(self.__class__)
+        new_player.__dict__.update(self.__dict__)
+        # player's face down table cards
+        new_player.face_down = self.face_down.copy()
+        # player's face up table cards
+        new_player.face_up = self.face_up.copy()
+        # player's hand cards.
+        new_player.hand = self.hand.copy()
+        return new_player
 
     def get_state(self):
         '''
@@ -947,22 +963,8 @@ class HumanPlayer(Player):
         :return:        copy of this player (not just reference).
         :rtype:         Player
         '''
-        new_player = HumanPlayer(self.name, self.gui, self.auto_end)
-        # number of turns played
-        new_player.turn_count = self.turn_count
-        # player's face down table cards
-        new_player.face_down = self.face_down.copy()
-        # player's face up table cards
-        new_player.face_up = self.face_up.copy()
-        # player's hand cards.
-        new_player.hand = self.hand.copy()
-        # must take face up table card as 2nd play
-        new_player.get_fup = self.get_fup
-        # rank of face up table card taken on 2nd play
-        new_player.get_fup_rank = self.get_fup_rank
-        # play 'END' automatically if it's the only option
-        new_player.auto_end = self.auto_end
-
+        new_player = super().copy()
+        new_player.clicked_play = None  # no play selected by mouse click yet
         return new_player
 
     def get_state(self):
@@ -1025,6 +1027,7 @@ class AiPlayer(Player):
         :type fdown_random:     bool
         '''
         super().__init__(name)      # set player's name
+        self.is_ai = True           # True => AI player
         self.fup_table = fup_table  # table with best fup card combinations.
         self.swap_count = 0         # state of face up table cards swapping
         self.best_fup = []          # list of 3 best face up table cards.
@@ -1107,8 +1110,9 @@ class AiPlayer(Player):
         :return:        copy of this player (not just reference).
         :rtype:         Player
         '''
-        raise NotImplementedError("This method must be implemented in the"
-                                  " subclass")
+        new_player = super().copy()
+        new_player.best_fup = self.best_fup[:]  # best face up table cards
+        return new_player
 
     def get_state(self):
         '''
@@ -1270,27 +1274,6 @@ class ShitHappens(AiPlayer):
         # select one play at random
         return random.choice(plays)
 
-    def copy(self):
-        '''
-        Creates a copy of itself.
-
-        :return:        copy of this player (not just reference).
-        :rtype:         Player
-        '''
-        new_player = ShitHappens(self.name, self.fup_table, self.fdown_random)
-        new_player.swap_count = self.swap_count     # swap phase state
-        new_player.best_fup = self.best_fup[:]      # best face up table cards
-        new_player.turn_count = self.turn_count     # number of turns played
-        new_player.face_down = self.face_down.copy()  # face down table cards
-        new_player.face_up = self.face_up.copy()    # face up table cards
-        new_player.hand = self.hand.copy()          # hand cards.
-        # True => must take face up table card as 2nd play
-        new_player.get_fup = self.get_fup
-        # rank of face up table card taken on 2nd play
-        new_player.get_fup_rank = self.get_fup_rank
-
-        return new_player
-
 
 # -----------------------------------------------------------------------------
 class CheapShit(AiPlayer):
@@ -1416,27 +1399,6 @@ class CheapShit(AiPlayer):
             cheapest = self.find_cheapest_play(plays, RANK_TO_VALUE_CHEAP_SHIT)
             return cheapest
 
-    def copy(self):
-        '''
-        Creates a copy of itself.
-
-        :return:        copy of this player (not just reference).
-        :rtype:         Player
-        '''
-        new_player = CheapShit(self.name, self.fup_table, self.fdown_random)
-        new_player.swap_count = self.swap_count     # swap phase state
-        new_player.best_fup = self.best_fup[:]      # best face up table cards
-        new_player.turn_count = self.turn_count     # number of turns played
-        new_player.face_down = self.face_down.copy()  # face down table cards
-        new_player.face_up = self.face_up.copy()     # face up table cards
-        new_player.hand = self.hand.copy()           # hand cards.
-        # True => must take face up table card as 2nd play
-        new_player.get_fup = self.get_fup
-        # rank of face up table card taken on 2nd play
-        new_player.get_fup_rank = self.get_fup_rank
-
-        return new_player
-
 
 # -----------------------------------------------------------------------------
 class TakeShit(AiPlayer):
@@ -1618,27 +1580,6 @@ class TakeShit(AiPlayer):
                 vmap = RANK_TO_VALUE         # '2' cheaper than '3'
             return self.find_cheapest_play(plays, vmap)
 
-    def copy(self):
-        '''
-        Creates a copy of itself.
-
-        :return:        copy of this player (not just reference).
-        :rtype:         Player
-        '''
-        new_player = TakeShit(self.name, self.fup_table, self.fdown_random)
-        new_player.swap_count = self.swap_count     # swap phase state
-        new_player.best_fup = self.best_fup[:]      # best face up table cards
-        new_player.turn_count = self.turn_count     # number of turns played
-        new_player.face_down = self.face_down.copy()  # face down table cards
-        new_player.face_up = self.face_up.copy()    # face up table cards
-        new_player.hand = self.hand.copy()          # hand cards.
-        # True => must take face up table card as 2nd play
-        new_player.get_fup = self.get_fup
-        # rank of face up table card taken on 2nd play
-        new_player.get_fup_rank = self.get_fup_rank
-
-        return new_player
-
 
 # -----------------------------------------------------------------------------
 class BullShit(AiPlayer):
@@ -2009,27 +1950,6 @@ class BullShit(AiPlayer):
                 hand_plays, RANK_TO_VALUE_CHEAP_SHIT)
             return cheapest
 
-    def copy(self):
-        '''
-        Creates a copy of itself.
-
-        :return:        copy of this player (not just reference).
-        :rtype:         Player
-        '''
-        new_player = BullShit(self.name, self.fup_table, self.fdown_random)
-        new_player.swap_count = self.swap_count     # swap phase state
-        new_player.best_fup = self.best_fup[:]      # best face up table cards
-        new_player.turn_count = self.turn_count     # number of turns played
-        new_player.face_down = self.face_down.copy()  # face down table cards
-        new_player.face_up = self.face_up.copy()    # face up table cards
-        new_player.hand = self.hand.copy()          # hand cards.
-        # True => must take face up table card as 2nd play
-        new_player.get_fup = self.get_fup
-        # rank of face up table card taken on 2nd play
-        new_player.get_fup_rank = self.get_fup_rank
-
-        return new_player
-
 
 def run_simulation(state, play):
     '''
@@ -2363,18 +2283,10 @@ class DeepShit(AiPlayer):
         :return:        copy of this player (not just reference).
         :rtype:         Player
         '''
-        new_player = DeepShit(self.name, self.fup_table, self.fdown_random)
-        new_player.swap_count = self.swap_count     # swap phase state
-        new_player.best_fup = self.best_fup[:]      # best face up table cards
-        new_player.turn_count = self.turn_count     # number of turns played
-        new_player.face_down = self.face_down.copy()  # face down table cards
-        new_player.face_up = self.face_up.copy()    # face up table cards
-        new_player.hand = self.hand.copy()          # hand cards.
-        # True => must take face up table card as 2nd play
-        new_player.get_fup = self.get_fup
-        # rank of face up table card taken on 2nd play
-        new_player.get_fup_rank = self.get_fup_rank
-
+        new_player = super().copy()
+        # the copy doesn't share the play selection thread
+        new_player.thread = None
+        new_player.thread_started = False
         return new_player
 
 
@@ -2665,25 +2577,10 @@ class DeeperShit(AiPlayer):
         :return:        copy of this player (not just reference).
         :rtype:         Player
         '''
-        new_player = DeeperShit(self.name, self.fup_table, self.fdown_random,
-                                self.timeout, self.policy, self.verbose)
-        # swap phase state
-        new_player.swap_count = self.swap_count
-        # best face up table cards
-        new_player.best_fup = self.best_fup[:]
-        # number of turns played
-        new_player.turn_count = self.turn_count
-        # player's face down table cards
-        new_player.face_down = self.face_down.copy()
-        # player's face up table cards
-        new_player.face_up = self.face_up.copy()
-        # player's hand cards.
-        new_player.hand = self.hand.copy()
-        # True => must take face up table card as 2nd play
-        new_player.get_fup = self.get_fup
-        # rank of face up table card taken on 2nd play
-        new_player.get_fup_rank = self.get_fup_rank
-
+        new_player = super().copy()
+        # the copy doesn't share the play selection thread
+        new_player.thread = None
+        new_player.thread_started = False
         return new_player
 
 
@@ -23,7 +23,6 @@ user.
 import arcade
 import json
 import argparse
-import os
 
 COLOR = arcade.color.BLACK
 
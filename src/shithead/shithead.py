@@ -31,26 +31,30 @@ import argparse
 from time import sleep
 import json
 
-import arcade
+import numpy as np
 
 # local imports (modules in same package)
 from .cards import Card
 from .game import Game
 from .fup_table import FupTable, FUP_TABLE_FILE
 from .state import State, SWAPPING_CARDS, FIND_STARTER, PLAY_GAME
-from .state import STARTING_SUITS, STARTING_RANKS
+from .state import STARTING_CODE
 from .play import Play
 from .stats import Statistics
-from .gui import GameView
-from . import start
 from . import player as plr     # to avoid confusion with variable 'player'
-from . import rules
 
 # Screen title and size
 SCREEN_WIDTH = 1024
 SCREEN_HEIGHT = 768
 SCREEN_TITLE = "Sh*thead"
 
+# command line parser (created on first use by get_parser())
+_parser = None
+
+# cards requested in the starting player auction (index = starting card)
+# => no need to create a new card on each turn during FIND_STARTER.
+STARTING_CARDS = [Card(0, suit, rank) for suit, rank in STARTING_CODE]
+
 
 # -----------------------------------------------------------------------------
 def gui_start():
@@ -64,6 +68,11 @@ def gui_start():
     rules.
     A 3rd button lets us continue to the configuration screen.
     """
+    # arcade and the gui modules are only imported when they are needed,
+    # i.e. the command line modes don't have to pay for their initialization.
+    import arcade
+    from . import start
+
     # open a window with predefined size and title
     window = arcade.Window(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE)
 
@@ -96,6 +105,10 @@ def load_state_from_file(config_file, state_file):
     :param state_file:  name of state JSON-file
     :type config_file:  str
     '''
+    # only import arcade and the gui when they are actually used
+    import arcade
+    from .gui import GameView
+
     try:
         # load configuration from json-file
         filename = config_file
@@ -140,6 +153,141 @@ def load_state_from_file(config_file, state_file):
     arcade.run()
 
 
+def prompt_positive_int(msg, lo=1, hi=None, default=None):
+    '''
+    Get an integer in the range lo..hi from the user.
+
+    If a default has been specified (e.g. with a command line option) and it
+    is in the valid range, it is returned without asking the user.
+    Otherwise, the user is asked to enter an integer until a valid number has
+    been entered.
+
+    :param msg:         prompt shown to the user.
+    :type msg:          str
+    :param lo:          smallest valid number.
+    :type lo:           int
+    :param hi:          biggest valid number (None => no upper limit).
+    :type hi:           int
+    :param default:     number used instead of asking the user.
+    :type default:      int
+    :return:            number in the range lo..hi.
+    :rtype:             int
+    '''
+    if hi is None:
+        hint = f'Please enter an integer >{lo - 1}!'
+    else:
+        hint = f'Please enter an integer between {lo} and {hi}!'
+
+    if default is not None:
+        if default >= lo and (hi is None or default <= hi):
+            return default
+        # invalid number specified => ask the user
+        print(f'{default} is not a valid number. {hint}')
+
+    while True:
+        n = input(msg)
+        try:
+            number = int(n)
+        except ValueError as err:
+            print(err)
+            print(hint)
+            continue
+        if number >= lo and (hi is None or number <= hi):
+            return number
+
+
+def _play_loop_auto(state, fup_table, stats):
+    '''
+    Game loop of play_round() without any output.
+
+    :param state:       game state after dealing the cards.
+    :type state:        State
+    :param fup_table:   face up table (not None => update fup_table).
+    :type fup_table:    FupTable
+    :param stats:       statistic => score, number of turns, number of games.
+    :type stats:        Statistic
+    :return:            'QUIT', 'ABORT', or name of shithead
+                        and number of turns played
+    :rtype:             tuple
+    '''
+    next_state = Game.next_state
+    while len(state.players) > 1:
+        # let the current player play one action
+        player = state.players[state.player]
+        while True:
+            play = player.play(state)
+            if play is not None:
+                break
+            # player not ready => wait 100 ms
+            sleep(0.1)
+        if play.action == 'QUIT':
+            Game.reset_result(state)    # no winners
+            # human player wants to quit the game
+            return ('QUIT', 0)
+        if play.action == 'ABORT':
+            Game.reset_result(state)    # no winners
+            # AI-test in deadlock, abort without result
+            return ('ABORT', 0)
+        # apply this  action to the current state to get to the next state
+        state = next_state(state, play, fup_table, stats)
+
+    # return name of shithead (last player still in the game)
+    return (state.players[0].name, state.players[0].turn_count)
+
+
+def _play_loop_verbose(state, fup_table, stats):
+    '''
+    Game loop of play_round() printing the state before each play.
+
+    Prompts the human player after each play of an AI player.
+
+    :param state:       game state after dealing the cards.
+    :type state:        State
+    :param fup_table:   face up table (not None => update fup_table).
+    :type fup_table:    FupTable
+    :param stats:       statistic => score, number of turns, number of games.
+    :type stats:        Statistic
+    :return:            'QUIT', 'ABORT', or name of shithead
+                        and number of turns played
+    :rtype:             tuple
+    '''
+    while len(state.players) > 1:
+        state.print()
+        if state.game_phase == SWAPPING_CARDS:
+            print('--- swap face up table with hand cards ---')
+        elif state.game_phase == FIND_STARTER:
+            card = STARTING_CARDS[state.starting_card]
+            print(f'--- show {card} to start the game ---')
+        elif state.game_phase == PLAY_GAME:
+            print('--- play ---')
+        # let the current player play one action
+        player = state.players[state.player]
+        while True:
+            play = player.play(state)
+            if play is not None:
+                break
+            # player not ready => wait 100 ms
+            sleep(0.1)
+        print(f'Plays: {play.action}-{play.index}')
+        if play.action == 'QUIT':
+            Game.reset_result(state)    # no winners
+            # human player wants to quit the game
+            return ('QUIT', 0)
+        if play.action == 'ABORT':
+            Game.reset_result(state)    # no winners
+            # AI-test in deadlock, abort without result
+            return ('ABORT', 0)
+        # apply this  action to the current state to get to the next state
+        state = Game.next_state(state, play, fup_table, stats)
+        print('---------------------------')
+        if player.is_ai:
+            # request prompt from human player after AI play.
+            input('Press <Return> to continue')
+
+    # return name of shithead (last player still in the game)
+    return (state.players[0].name, state.players[0].turn_count)
+
+
 def play_round(players, shithead, fup_table=None, stats=None, auto=False):
     '''
     Play one round of shithead without GUI.
@@ -210,59 +358,23 @@ def play_round(players, shithead, fup_table=None, stats=None, auto=False):
     # deal 3 face down, 3 face up, and 3 hand cards to each player
     state = Game.next_state(state, Play('DEAL'), fup_table, stats)
 
-    # game loop
-    while len(state.players) > 1:
-        # play until only one player is left
-        if not auto:
-            state.print()
-        if state.game_phase == SWAPPING_CARDS:
-            if not auto:
-                print('--- swap face up table with hand cards ---')
-        elif state.game_phase == FIND_STARTER:
-            suit = STARTING_SUITS[state.starting_card % 4]
-            rank = STARTING_RANKS[state.starting_card // 4]
-            card = Card(0, suit, rank)
-            if not auto:
-                print(f'--- show {card} to start the game ---')
-        elif state.game_phase == PLAY_GAME:
-            if not auto:
-                print('--- play ---')
-        # let the current player play one action
-        player = state.players[state.player]
-        while True:
-            play = player.play(state)
-            if play is not None:
-                break
-            # player not ready => wait 100 ms
-            sleep(0.1)
-        if not auto:
-            print(f'Plays: {play.action}-{play.index}')
-        if play.action == 'QUIT':
-            Game.reset_result(state)    # no winners
-            # human player wants to quit the game
-            return ('QUIT', 0)
-        if play.action == 'ABORT':
-            Game.reset_result(state)    # no winners
-            # AI-test in deadlock, abort without result
-            return ('ABORT', 0)
-        # apply this  action to the current state to get to the next state
-        state = Game.next_state(state, play, fup_table, stats)
-        if not auto:
-            print('---------------------------')
-        if not auto and isinstance(player, plr.AiPlayer):
-            # request prompt from human player after AI play.
-            input('Press <Return> to continue')
-
-    # return name of shithead (last player still in the game)
-    return (state.players[0].name, state.players[0].turn_count)
+    # game loop, play until only one player is left
+    if auto:
+        return _play_loop_auto(state, fup_table, stats)
+    return _play_loop_verbose(state, fup_table, stats)
 
 
-def fup_table_generator():
+def fup_table_generator(n_players=None, n_games=None):
     '''
     Generates or updates the face up table.
     Lets 3 AI players of same level play multiple games with random face up
     table cards (no swapping). The result of each game is used to update the
     face up table files.
+
+    :param n_players:   number of players (None => ask user).
+    :type n_players:    int
+    :param n_games:     number of games (None => ask user).
+    :type n_games:      int
     '''
     # statistic counters
     n_finished = 0  # number of finished games
@@ -281,28 +393,11 @@ def fup_table_generator():
 
     print('### Face Up Table Generator ###')
     # get number of players
-    while True:
-        n = input('Enter number of players (>1): ')
-        try:
-            n_players = int(n)
-        except ValueError as err:
-            print(err)
-            print('Please enter an integer >1!')
-            continue
-        if n_players > 1:
-            break
+    n_players = prompt_positive_int('Enter number of players (>1): ', 2,
+                                    default=n_players)
 
     # get number of games
-    while True:
-        n = input('Enter number games: ')
-        try:
-            n_games = int(n)
-        except ValueError as err:
-            print(err)
-            print('Please enter an integer >0!')
-            continue
-        if n_games > 0:
-            break
+    n_games = prompt_positive_int('Enter number games: ', default=n_games)
 
     # create specified number of players with generic names
     players = []
@@ -370,8 +465,9 @@ def play_ai_evaluation_round(players, stats=None):
     :param stats:       statistic => score, number of turns, number of games.
     :type stats:        Statistic
     :return:            number of aborted rounds, number of finished rounds,
-                        and total number of turns played
-    :rtype:             tuple
+                        total number of turns played, total number of talon
+                        cards, and total number of turns till talon is empty.
+    :rtype:             numpy.ndarray
     '''
 
     # statistic counters
@@ -455,10 +551,12 @@ def play_ai_evaluation_round(players, stats=None):
                   f"|{n_turns:^9}|{n_refills:^9}"
                   f"|                                    |", end='\r')
 
-    return (n_aborted, n_finished, n_turns, n_talon, n_refills)
+    # return the counters as array => caller adds them up in a single step
+    return np.array((n_aborted, n_finished, n_turns, n_talon, n_refills),
+                    dtype=np.int64)
 
 
-def ai_test():
+def ai_test(n_games=None):
     '''
     Testing out different AIs.
 
@@ -468,14 +566,14 @@ def ai_test():
     hand and table cards as any other player. To further mitigate randomness
     all players play their face down table cards from left to right.
     Prints final scores per AI.
+
+    :param n_games:     number of rounds (None => ask user).
+    :type n_games:      int
     '''
 
-    # statistic counters
-    n_finished = 0  # number of finished games
-    n_aborted = 0   # number of aborted games
-    n_turns = 0     # number of turns played
-    n_talon = 0     # number of talon cards
-    n_refills = 0   # number of refills
+    # statistic counters:
+    # aborted games, finished games, turns played, talon cards, refills
+    totals = np.zeros(5, dtype=np.int64)
 
     # create face up table
     fup_table = FupTable()
@@ -505,16 +603,7 @@ def ai_test():
     print("\n")
 
     # get number of games
-    while True:
-        n = input('Enter number of rounds: ')
-        try:
-            n_games = int(n)
-        except ValueError as err:
-            print(err)
-            print('Please enter an integer >0!')
-            continue
-        if n_games > 0:
-            break
+    n_games = prompt_positive_int('Enter number of rounds: ', default=n_games)
 
     # print test log header
     print("\n| finished | aborted |  turns  | refills "
@@ -526,13 +615,8 @@ def ai_test():
 
     for _ in range(n_games):
         # play a round, don't update face up table, update player statistics
-        aborts, finished, turns, talon, refills = play_ai_evaluation_round(
-            players, stats)
-        n_aborted += aborts
-        n_finished += finished
-        n_turns += turns
-        n_talon += talon
-        n_refills += refills
+        totals += play_ai_evaluation_round(players, stats)
+        n_aborted, n_finished, n_turns, _, n_refills = totals.tolist()
 
         # create string with shitcount per player
         sh_cnt_str = ''
@@ -559,12 +643,15 @@ def ai_test():
     stats.save('ai_test_stats.json')
 
 
-def gameplay_test():
+def gameplay_test(n_players=None):
     '''
     Shithead game with one human player against 1..5 AIs.
 
     Shows all cards.
     Human player has to prompt any AI play.
+
+    :param n_players:   number of players (None => ask user).
+    :type n_players:    int
     '''
     # create face up table
     fup_table = FupTable()
@@ -574,16 +661,8 @@ def gameplay_test():
 
     print('### Gameplay Test ###')
     # get number of players
-    while True:
-        n = input('Enter number of players (>1): ')
-        try:
-            n_players = int(n)
-        except ValueError as err:
-            print(err)
-            print('Please enter an integer >1!')
-            continue
-        if n_players > 1:
-            break
+    n_players = prompt_positive_int('Enter number of players (>1): ', 2,
+                                    default=n_players)
 
     # create specified number of players with generic names
     players = []
@@ -602,13 +681,16 @@ def gameplay_test():
         print(f'{shithead} is the Shithead!!!')
 
 
-def test_state_copy():
+def test_state_copy(n_players=None):
     """
     Test copying a game state.
 
     Creates an initial game state.
     Burns some cards, shuffles the talon, and deals cards to the players.
     Makes a copy of the resulting game state and prints it out.
+
+    :param n_players:   number of players (None => ask user).
+    :type n_players:    int
     """
     # create face up table, the AIs use it for optimum card swapping
     fup_table = FupTable()
@@ -617,16 +699,8 @@ def test_state_copy():
     fup_table.load(FUP_TABLE_FILE, True)
 
     # get number of players
-    while True:
-        n = input('Enter number of players (2..6): ')
-        try:
-            n_players = int(n)
-        except ValueError as err:
-            print(err)
-            print('Please enter an integer >1!')
-            continue
-        if n_players > 1 and n_players < 7:
-            break
+    n_players = prompt_positive_int('Enter number of players (2..6): ', 2, 6,
+                                    default=n_players)
 
     # create specified number of players with generic names
     players = []
@@ -669,6 +743,10 @@ def open_rules_window(filename):
     :param filename:    name of json-file containing rules text.
     :type filename:     str
     """
+    # only import arcade and the rules view when they are actually used
+    import arcade
+    from . import rules
+
     # load parameters and texts from JSON-file
     try:
         with open(filename, 'r', encoding='utf-8') as json_file:
@@ -759,13 +837,16 @@ def play_end_game_generator_round(players, stats=None):
         return None
 
 
-def end_game_generator():
+def end_game_generator(n_games=None):
     '''
     Generates end game states saved as JSON files.
 
     Let 3 AIs play multiple fully automatic games.
     Whenever a game reaches the point where only 2 players are left, we store
     the corresponding state to a JSON file, in order to use it for MCTS tests.
+
+    :param n_games:     number of games (None => ask user).
+    :type n_games:      int
     '''
     # create face up table
     fup_table = FupTable()
@@ -785,16 +866,7 @@ def end_game_generator():
     players.append(plr.TakeShit('Player3', fup_table, False))
 
     # get number of games
-    while True:
-        n = input('Enter number of games: ')
-        try:
-            n_games = int(n)
-        except ValueError as err:
-            print(err)
-            print('Please enter an integer >0!')
-            continue
-        if n_games > 0:
-            break
+    n_games = prompt_positive_int('Enter number of games: ', default=n_games)
 
     for i in range(n_games):
         # play a round, don't update face up table, update player statistics
@@ -805,7 +877,7 @@ def end_game_generator():
                 f.write(json_str)
 
 
-def end_game_evaluation(state_file):
+def end_game_evaluation(state_file, n_games=None):
     """
     Load and play end game by selecting plays randomly.
 
@@ -821,6 +893,8 @@ def end_game_evaluation(state_file):
 
     :param state_file:      name of file containing end game state.
     :type state_file:       str
+    :param n_games:         number of games (None => ask user).
+    :type n_games:          int
 
     """
     try:
@@ -872,16 +946,7 @@ def end_game_evaluation(state_file):
         players.append(plr.ShitHappens('', fup_table))
 
     # get number of games
-    while True:
-        n = input('Enter number of games: ')
-        try:
-            n_games = int(n)
-        except ValueError as err:
-            print(err)
-            print('Please enter an integer >0!')
-            continue
-        if n_games > 0:
-            break
+    n_games = prompt_positive_int('Enter number of games: ', default=n_games)
 
     for _ in range(n_games):
         refill_turns = -1
@@ -922,7 +987,8 @@ def end_game_evaluation(state_file):
         state.auction_members = state_info['auction_members']
         state.shown_starting_card = state_info['shown_starting_card']
         state.result = state_info['result']
-        state.history = state_info['history']
+        state.history = [Play.from_string(play).encode()
+                         for play in state_info['history']]
         # reset 'dealing' flag
         state.dealing = False
 
@@ -974,6 +1040,66 @@ def end_game_evaluation(state_file):
     stats.print()
 
 
+def get_parser():
+    """
+    Get the command line parser.
+
+    The parser is created on the 1st call and then kept at module level, i.e.
+    all further calls return the same parser.
+
+    :return:    command line parser with all shithead options.
+    :rtype:     argparse.ArgumentParser
+    """
+    global _parser
+    if _parser is not None:
+        return _parser
+
+    parser = argparse.ArgumentParser()
+    group = parser.add_mutually_exclusive_group(required=False)
+
+    group.add_argument("-g", "--gen-fuptab",
+                       help=("generate a lookup table for the face up table"
+                             " card swapping"),
+                       action="store_true")
+    group.add_argument("-t", "--test-ai",
+                       help="run a number of games to test the AI players",
+                       action="store_true")
+    group.add_argument("-c", "--cli-game",
+                       help=("play game with human player using the command"
+                             " line interface"),
+                       action="store_true")
+    group.add_argument("-d", "--debugging",
+                       type=str,
+                       help=("load a game state from a JSON-file written with"
+                             " log-level 'Debugging'"))
+    group.add_argument("-r", "--rules",
+                       type=str,
+                       help=("opens a window with shithead rules loaded from"
+                             " the specified JSON-file'"))
+    group.add_argument("-e", "--end-game-generator",
+                       help=("run a number of games to generate end game"
+                             " states"),
+                       action="store_true")
+    group.add_argument("-v", "--end-game-evaluation",
+                       type=str,
+                       help="Run multiple games from same end game state")
+    parser.add_argument("-f", "--filename",
+                        type=str,
+                        help=("config file used when state was written with"
+                              " log-level 'Debugging'"))
+    parser.add_argument("--n-players",
+                        type=int,
+                        help=("number of players used with options -g and -c"
+                              " (default: ask for it)"))
+    parser.add_argument("--n-games",
+                        type=int,
+                        help=("number of games used with options -g, -t, -e,"
+                              " and -v (default: ask for it)"))
+
+    _parser = parser
+    return _parser
+
+
 def main():
     """
     Starts a shithead game according to the specified command line option:
@@ -1021,49 +1147,20 @@ def main():
         Updates the game statistics => helps us find an end game state, with
         equal odds for both players. This way we can decide if an end game
         strategy (e.g. MCTS) gives its player an advantage.
-    """
-    parser = argparse.ArgumentParser()
-    group = parser.add_mutually_exclusive_group(required=False)
 
-    group.add_argument("-g", "--gen-fuptab",
-                       help=("generate a lookup table for the face up table"
-                             " card swapping"),
-                       action="store_true")
-    group.add_argument("-t", "--test-ai",
-                       help="run a number of games to test the AI players",
-                       action="store_true")
-    group.add_argument("-c", "--cli-game",
-                       help=("play game with human player using the command"
-                             " line interface"),
-                       action="store_true")
-    group.add_argument("-d", "--debugging",
-                       type=str,
-                       help=("load a game state from a JSON-file written with"
-                             " log-level 'Debugging'"))
-    group.add_argument("-r", "--rules",
-                       type=str,
-                       help=("opens a window with shithead rules loaded from"
-                             " the specified JSON-file'"))
-    group.add_argument("-e", "--end-game-generator",
-                       help=("run a number of games to generate end game"
-                             " states"),
-                       action="store_true")
-    group.add_argument("-v", "--end-game-evaluation",
-                       type=str,
-                       help="Run multiple games from same end game state")
-    parser.add_argument("-f", "--filename",
-                        type=str,
-                        help=("config file used when state was written with"
-                              " log-level 'Debugging'"))
-
-    args = parser.parse_args()
+        --n-players N_PLAYERS, --n-games N_GAMES
+        Number of players and number of games used with the options above.
+        If not specified, the user is asked to enter them, i.e. these options
+        allow us to run the AI tests without any keyboard input.
+    """
+    args = get_parser().parse_args()
 
     if args.gen_fuptab:
-        fup_table_generator()
+        fup_table_generator(args.n_players, args.n_games)
     elif args.test_ai:
-        ai_test()
+        ai_test(args.n_games)
     elif args.cli_game:
-        gameplay_test()
+        gameplay_test(args.n_players)
     elif args.debugging:
         if args.filename is None:
             raise ValueError("Specify config file used with this debugging"
@@ -1072,9 +1169,9 @@ def main():
     elif args.rules:
         open_rules_window(args.rules)
     elif args.end_game_generator:
-        end_game_generator()
+        end_game_generator(args.n_games)
     elif args.end_game_evaluation:
-        end_game_evaluation(args.end_game_evaluation)
+        end_game_evaluation(args.end_game_evaluation, args.n_games)
 
     else:
         gui_start()
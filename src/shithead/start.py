@@ -3,15 +3,15 @@ Starting Screen.
 
 Arcade view showing the title screen.
 Writes 'Masters of' at the top of the screen.
-Next 'SHITHEAD' is written with face down cards in an animated sequence from
-left to write followed by flipping the cards over from right to left.
+Next 'SHITHEAD' is written with face up cards in an animated sequence from
+left to right, each card fading in after it has been added.
 Finally we get a line with the version, a 'Programmed with ...'
 and a 'Game Assets from ...' statement.
 At the bottom of the screen the buttons to open additional screens with English
 and German rules and the 'CONTINUE' button, which brings us to the
 configuration screen, are placed.
 Position and angle for the card sprites used in the title animation are loaded
-from a json file.
+from a binary file (-> convert_title.py).
 Pressing the 'RULES' or 'REGELN' button each starts a 'rules.py' subprocess
 (Popen) which loads either the English or the German rules from the
 corresponding json file.
@@ -19,20 +19,18 @@ corresponding json file.
 23.04.2023 Wolfgang Trachsler
 """
 
-import subprocess
-import json
 import pkgutil
+import random
 import os
 import sys
-import platform
 
 import arcade
+import numpy as np
+import pyglet
 
 # local imports (modules in same package)
-from .cards import Deck
+from .cards import Card, CARD_SUITS, CARD_RANKS
 from .gui import CardSprite
-from . import config
-from . import rules
 
 VERSION = '1.0.5'
 
@@ -44,11 +42,17 @@ SCREEN_TITLE = "Sh*thead"
 DEFAULT_LINE_HEIGHT = 18
 DEFAULT_FONT_SIZE = 12
 COLOR = arcade.color.WHITE
+# font and color (RGBA) of static texts (pyglet labels drawn as batch)
+LABEL_FONT = ('calibri', 'arial')
+LABEL_COLOR = (255, 255, 255, 255)
 
 # dimensions of buttons
 BUTTON_SCALE = 0.7
 BUTTON_RELEASED = ":resources:gui_basic_assets/red_button_normal.png"
 BUTTON_PRESSED = ":resources:gui_basic_assets/red_button_press.png"
+# index of button textures in the texture list of the button sprites
+RELEASED_INDEX = 0
+PRESSED_INDEX = 1
 
 # position of Version
 VERSION_Y = 444
@@ -68,8 +72,23 @@ CONTINUE_STATE = 3      # 'CONTINUE' button pressed
 # scale of cards used in title
 CARD_SCALE = 0.16
 
+# time per step of the title animation (1 card per step)
+TITLE_STEP = 1 / 60
+# increase of alpha per step while a title card fades in (8 steps)
+TITLE_FADE = 32
+
+# update rate of the start screen and of all other views
+START_UPDATE_RATE = 1 / 30
+DEFAULT_UPDATE_RATE = 1 / 60
+
+# number of frames to draw after a change (front and back buffer)
+REDRAW_FRAMES = 2
+
 # File containing position and angle of card sprites for title animation.
-TITLE_FILE = 'title.json'
+# (binary file with x, y, angle as little-endian float32 per card,
+#  created from title.json with convert_title.py)
+TITLE_FILE = 'title.bin'
+TITLE_DTYPE = '<f4'
 
 
 class StartView(arcade.View):
@@ -87,17 +106,28 @@ class StartView(arcade.View):
         # set the background color to amazon green.
         arcade.set_background_color(arcade.color.AMAZON)
 
-        # list holding cards for title after creation, not shown yet
-        self.card_list = []
-
         # create a sprite list for the animated title sequence
+        # (card sprites are only created when they are added to the title)
         self.title = arcade.SpriteList()
+        self.title_coords = None    # array with x, y, angle per title card
+        self.title_cards = iter(())     # shuffled cards used in title
         self.title_index = 0    # counter for animation
-        self.title_fup = False  # True => face up animation
+        self.title_fade = 0     # index of 1st title card still fading in
         self.title_len = 0      # number of cards in title
+        self.title_done = False     # True => animation finished
+        self.title_time = 0.0       # time not yet used for animation steps
+
+        # number of frames still to be drawn (0 => screen is up to date)
+        self.redraw = REDRAW_FRAMES
 
-        # create text list
-        self.text_list = []
+        # create text list for the 'Masters of' title (drawn before the
+        # animation).
+        self.big_text_list = []
+
+        # the static texts shown after the animation (info and button labels)
+        # share font, size, and color => draw them as batch
+        self.text_batch = pyglet.graphics.Batch()
+        self.label_list = []
 
         # create a sprite list for the 'RULES', 'REGELN' and 'CONTINUE'
         # buttons.
@@ -105,15 +135,22 @@ class StartView(arcade.View):
         self.english = None         # 'RULES' button
         self.german = None          # 'REGELN' button
         self.config = None          # 'CONTINUE' button
+        self.buttons = ()           # all 3 buttons (after setup)
+        self.rules_argv = {}        # rules command line per button state
+        self.button_boxes = []      # (button, state, left, right, bottom, top)
         self.state = IDLE_STATE     # no button pressed
 
+        # button textures (loaded once in setup)
+        self.released_texture = None
+        self.pressed_texture = None
+
     def setup_text_objects(self):
         """
         Setup the text objects.
         We create a text object for the 'Masters of' which appears before the
         main title (which is not a text object but a set of card sprites).
         After the main title, there will be the version and some additional
-        information.
+        information (label in the text batch).
         """
         # create the main title text object
         start_x = 0
@@ -121,29 +158,26 @@ class StartView(arcade.View):
         text = arcade.Text(
             'Masters of', start_x, start_y, arcade.color.BRIGHT_GREEN,
             DEFAULT_FONT_SIZE * 2, width=SCREEN_WIDTH, align='center')
-        self.text_list.append(text)
+        self.big_text_list.append(text)
 
-        # create version text object
+        # create one multiline label for version, programmed with ...
+        # and game assets from ... lines (part of the text batch).
         start_y = VERSION_Y
-        text = arcade.Text(
-            VERSION, start_x, start_y, arcade.color.WHITE, DEFAULT_FONT_SIZE,
-            width=SCREEN_WIDTH, align='center')
-        self.text_list.append(text)
-
-        # create programmed with ... text object
-        start_y = text.bottom - DEFAULT_LINE_HEIGHT
-        text = arcade.Text(
-            'Programmed with Python3/Arcade Library', start_x, start_y,
-            arcade.color.WHITE, DEFAULT_FONT_SIZE, width=SCREEN_WIDTH,
-            align='center')
-        self.text_list.append(text)
-
-        # create game assets from ... text object
-        start_y = text.bottom - DEFAULT_LINE_HEIGHT
-        text = arcade.Text(
-            'Game Assets from kenney.nl', start_x, start_y, arcade.color.WHITE,
-            DEFAULT_FONT_SIZE, width=SCREEN_WIDTH, align='center')
-        self.text_list.append(text)
+        info = (f'{VERSION}\n'
+                'Programmed with Python3/Arcade Library\n'
+                'Game Assets from kenney.nl')
+        label = pyglet.text.Label(
+            info,
+            font_name=LABEL_FONT,
+            font_size=DEFAULT_FONT_SIZE,
+            x=start_x,
+            y=start_y,
+            width=SCREEN_WIDTH,
+            color=LABEL_COLOR,
+            align='center',
+            multiline=True,
+            batch=self.text_batch)
+        self.label_list.append(label)
 
     def setup_main_title(self):
         """
@@ -151,12 +185,12 @@ class StartView(arcade.View):
 
         We use playing cards to write out the main title 'SHITHEAD' in large
         letters. Position and angle for each card is has been generated with an
-        additional tool and can be loaded from a json file.
+        additional tool and can be loaded from a binary file.
         To have different cards in the title each time we start the program,
         we create 6 decks (we need 220 cards but want an even distribution of
-        red and blue backs) and shuffle them. From these cards we then create
-        the card sprites (initially face down) with the loaded position and
-        angles.
+        red and blue backs) and pick the title cards from them in random order.
+        The card sprites (face up, transparent) are created from these cards
+        with the loaded position and angle during the animation.
         """
         # load coords of cards forming the title
         try:
@@ -166,104 +200,148 @@ class StartView(arcade.View):
             print(f"### Error couldn't load file {TITLE_FILE}")
             return
 
-        # deserialize the json data
-        title_coords = json.loads(data)
+        # use the binary data as array (1 row per card), no parsing needed
+        self.title_coords = np.frombuffer(
+            data, dtype=TITLE_DTYPE).reshape(-1, 3)
 
         # determine the number of cards in the title
-        self.title_len = len(title_coords)
+        self.title_len = len(self.title_coords)
 
-        # create 6 Decks and shuffle them
+        # create the cards of 6 decks in one go and pick the title cards in
+        # random order (no need to shuffle the cards we don't use).
         # we need 220 cards but want an even distribution of red and blue backs
-        cards = Deck(0)
-        for i in range(1, 6):
-            cards += Deck(i)
-        cards.shuffle()
-
-        # for each set of coords/angle in title_coords create a sprite
-        # (face down) and add it to the card list.
-        for coord in title_coords:
-            card = cards.pop_card()
-            card_sprite = CardSprite(card, CARD_SCALE)
-            card_sprite.position = (coord[0], coord[1])
-            card_sprite.angle = coord[2]
-            self.card_list.append(card_sprite)
+        cards = [Card(did, suit, rank) for did in range(6)
+                 for suit in CARD_SUITS for rank in CARD_RANKS]
+        self.title_cards = iter(random.sample(cards, self.title_len))
 
     def setup_english_rules_button(self):
         """
-        Creates 'RULES' button sprite and text object.
+        Creates 'RULES' button sprite and label.
 
         Creates a button sprite.
         Adds the created button sprite to the button sprite list.
-        Creates the 'RULES' text object and adds it to the text object list.
+        Creates the 'RULES' label and adds it to the text batch.
         """
         self.english = arcade.Sprite(
-            BUTTON_RELEASED, BUTTON_SCALE, hit_box_algorithm='None')
+            scale=BUTTON_SCALE, hit_box_algorithm='None',
+            texture=self.released_texture)
+        self.english.append_texture(self.pressed_texture)
         self.english.position = (ENGLISH_X, BUTTON_Y)
         self.button_list.append(self.english)
 
-        # create button text
-        text = arcade.Text(
+        # create button label (part of the text batch)
+        label = pyglet.text.Label(
             'RULES',
-            ENGLISH_X,
-            BUTTON_Y,
-            arcade.color.WHITE,
-            DEFAULT_FONT_SIZE,
+            font_name=LABEL_FONT,
+            font_size=DEFAULT_FONT_SIZE,
+            x=ENGLISH_X,
+            y=BUTTON_Y,
+            color=LABEL_COLOR,
             anchor_x='center',
-            anchor_y='center')
-        self.text_list.append(text)
+            anchor_y='center',
+            batch=self.text_batch)
+        self.label_list.append(label)
 
     def setup_german_rules_button(self):
         """
-        Creates 'REGELN' button sprite and text object.
+        Creates 'REGELN' button sprite and label.
 
         Creates a button sprite.
         Adds the created button sprite to the button sprite list.
-        Creates the 'REGELN' text object and adds it to the text object list.
+        Creates the 'REGELN' label and adds it to the text batch.
         """
         self.german = arcade.Sprite(
-            BUTTON_RELEASED, BUTTON_SCALE, hit_box_algorithm='None')
+            scale=BUTTON_SCALE, hit_box_algorithm='None',
+            texture=self.released_texture)
+        self.german.append_texture(self.pressed_texture)
         self.german.position = (GERMAN_X, BUTTON_Y)
         self.button_list.append(self.german)
 
-        # create button text
-        text = arcade.Text(
+        # create button label (part of the text batch)
+        label = pyglet.text.Label(
             'REGELN',
-            GERMAN_X,
-            BUTTON_Y,
-            arcade.color.WHITE,
-            DEFAULT_FONT_SIZE,
+            font_name=LABEL_FONT,
+            font_size=DEFAULT_FONT_SIZE,
+            x=GERMAN_X,
+            y=BUTTON_Y,
+            color=LABEL_COLOR,
             anchor_x='center',
-            anchor_y='center')
-        self.text_list.append(text)
+            anchor_y='center',
+            batch=self.text_batch)
+        self.label_list.append(label)
 
     def setup_continue_button(self):
         """
-        Creates 'CONTINUE' button sprite and text object.
+        Creates 'CONTINUE' button sprite and label.
 
         Creates a button sprite.
         Adds the created button sprite to the button sprite list.
-        Creates the 'CONTINUE' text object.
+        Creates the 'CONTINUE' label and adds it to the text batch.
         """
         self.config = arcade.Sprite(
-            BUTTON_RELEASED, BUTTON_SCALE, hit_box_algorithm='None')
+            scale=BUTTON_SCALE, hit_box_algorithm='None',
+            texture=self.released_texture)
+        self.config.append_texture(self.pressed_texture)
         self.config.position = (CONTINUE_X, BUTTON_Y)
         self.button_list.append(self.config)
 
-        # create button text
-        text = arcade.Text(
+        # create button label (part of the text batch)
+        label = pyglet.text.Label(
             'CONTINUE',
-            CONTINUE_X,
-            BUTTON_Y,
-            arcade.color.WHITE,
-            DEFAULT_FONT_SIZE,
+            font_name=LABEL_FONT,
+            font_size=DEFAULT_FONT_SIZE,
+            x=CONTINUE_X,
+            y=BUTTON_Y,
+            color=LABEL_COLOR,
             anchor_x='center',
-            anchor_y='center')
-        self.text_list.append(text)
+            anchor_y='center',
+            batch=self.text_batch)
+        self.label_list.append(label)
+
+    def setup_rules_commands(self):
+        """
+        Creates the command lines used to open the rules windows.
+
+        Neither the platform nor the executable change while the program is
+        running, i.e. we create the command lines for the 'RULES' and the
+        'REGELN' button only once.
+        """
+        # HACK to get paths to rules.py, rules_eng.json, and rules_ger.json
+        # (rules.py is in the same package directory as this module)
+        # find a better way
+        rules_dir = os.path.dirname(__file__)
+        rules_prg = os.path.join(rules_dir, 'rules.py')
+        if sys.platform.startswith('linux'):
+            # set files with Linux specific parameters (size, font)
+            rules_eng = os.path.join(rules_dir, 'rules_eng.json')
+            rules_ger = os.path.join(rules_dir, 'rules_ger.json')
+        else:
+            # set files with Windows specific parameters (size, font)
+            rules_eng = os.path.join(rules_dir, 'ms_rules_eng.json')
+            rules_ger = os.path.join(rules_dir, 'ms_rules_ger.json')
+
+        if os.path.basename(sys.executable) in ('shithead.exe', 'shithead'):
+            # pyinstaller executable for windows or linux
+            # shithead.exe -r ms_rules_eng.json
+            # shithead -r rules_eng.json
+            self.rules_argv[ENGLISH_STATE] = [sys.executable, '-r', rules_eng]
+            self.rules_argv[GERMAN_STATE] = [sys.executable, '-r', rules_ger]
+        else:
+            # python3 rules.py rules_eng.json
+            self.rules_argv[ENGLISH_STATE] = [sys.executable, rules_prg,
+                                              rules_eng]
+            self.rules_argv[GERMAN_STATE] = [sys.executable, rules_prg,
+                                             rules_ger]
 
     def setup(self):
         """
         Setup start window.
         """
+        # load the button textures once (shared by all 3 buttons)
+        self.released_texture = arcade.load_texture(
+            BUTTON_RELEASED, hit_box_algorithm='None')
+        self.pressed_texture = arcade.load_texture(
+            BUTTON_PRESSED, hit_box_algorithm='None')
         # setup the cards for the main title
         self.setup_main_title()
         # setup the text objects
@@ -272,6 +350,17 @@ class StartView(arcade.View):
         self.setup_english_rules_button()
         self.setup_german_rules_button()
         self.setup_continue_button()
+        self.buttons = (self.english, self.german, self.config)
+        # the buttons don't move => store their boundaries for click tests
+        self.button_boxes = [
+            (sprite, state, sprite.left, sprite.right, sprite.bottom,
+             sprite.top)
+            for sprite, state in zip(
+                self.buttons, (ENGLISH_STATE, GERMAN_STATE, CONTINUE_STATE))]
+        # setup the command lines for the rules windows
+        self.setup_rules_commands()
+        # 30 updates per second are plenty for the start screen
+        self.window.set_update_rate(START_UPDATE_RATE)
 
     def on_mouse_press(self, x, y, button, modifiers):
         """
@@ -291,22 +380,14 @@ class StartView(arcade.View):
         :param modifiers:       key modifiers (SHIFT, ALT, etc.)
         :type modifiers:        int
         """
-        # check if we have pressed the button
-        button = arcade.get_sprites_at_point((x, y), self.button_list)
-        if len(button) > 0:
-            # mouse clicked on one of the buttons
-            if button[0] == self.english:
-                # clicked the 'RULES' button
-                self.english.texture = arcade.load_texture(BUTTON_PRESSED)
-                self.state = ENGLISH_STATE
-            elif button[0] == self.german:
-                # clicked the 'REGELN' button
-                self.german.texture = arcade.load_texture(BUTTON_PRESSED)
-                self.state = GERMAN_STATE
-            else:
-                # clicked the 'CONTINUE' button
-                self.config.texture = arcade.load_texture(BUTTON_PRESSED)
-                self.state = CONTINUE_STATE
+        # check if we have pressed one of the buttons
+        for sprite, state, left, right, bottom, top in self.button_boxes:
+            if left <= x <= right and bottom <= y <= top:
+                # clicked 'RULES', 'REGELN', or 'CONTINUE' button
+                sprite.set_texture(PRESSED_INDEX)
+                self.state = state
+                self.redraw = REDRAW_FRAMES
+                break
         else:
             # none of the buttons clicked
             self.state = IDLE_STATE
@@ -326,50 +407,23 @@ class StartView(arcade.View):
         :param modifiers:       key modifiers (SHIFT, ALT, etc.)
         :type modifiers:        int
         """
-        # HACK to get paths to rules.py, rules_eng.json, and rules_ger.json
-        # find a better way
-        rules_dir = os.path.dirname(rules.__file__)
-        rules_prg = os.path.join(rules_dir, 'rules.py')
-        if platform.system() == 'Linux':
-            # set files with Linux specific parameters (size, font)
-            rules_eng = os.path.join(rules_dir, 'rules_eng.json')
-            rules_ger = os.path.join(rules_dir, 'rules_ger.json')
-        else:
-            # set files with Windows specific parameters (size, font)
-            rules_eng = os.path.join(rules_dir, 'ms_rules_eng.json')
-            rules_ger = os.path.join(rules_dir, 'ms_rules_ger.json')
+        # only needed after a button click => not imported at program start
+        import subprocess
+        from . import config
 
         # load the released button image into all button sprites
-        self.english.texture = arcade.load_texture(BUTTON_RELEASED)
-        self.german.texture = arcade.load_texture(BUTTON_RELEASED)
-        self.config.texture = arcade.load_texture(BUTTON_RELEASED)
+        for button_sprite in self.buttons:
+            button_sprite.set_texture(RELEASED_INDEX)
+        self.redraw = REDRAW_FRAMES
         # execute the action of the pressed button
-        if self.state == ENGLISH_STATE:
-            # open window with english rules
-            if os.path.basename(sys.executable) == 'shithead.exe':
-                # pyinstaller executable for windows
-                # shithead.exe -r ms_rules_eng.json
-                subprocess.Popen([sys.executable, '-r', rules_eng])
-            elif os.path.basename(sys.executable) == 'shithead':
-                # pyinstaller executable for linux
-                # shithead -r rules_eng.json
-                subprocess.Popen([sys.executable, '-r', rules_eng])
-            else:
-                # python3 rules.py rules_eng.json
-                subprocess.Popen([sys.executable, rules_prg, rules_eng])
-        elif self.state == GERMAN_STATE:
-            # open window with german rules
-            if os.path.basename(sys.executable) == 'shithead.exe':
-                # pyinstaller executable for windows
-                # shithead.exe -r ms_rules_ger.json
-                subprocess.Popen([sys.executable, '-r', rules_ger])
-            elif os.path.basename(sys.executable) == 'shithead':
-                # pyinstaller executable for windows
-                # shithead -r rules_ger.json
-                subprocess.Popen([sys.executable, '-r', rules_ger])
-            else:
-                # python3 rules.py rules_ger.json
-                subprocess.Popen([sys.executable, rules_prg, rules_ger])
+        if self.state in self.rules_argv:
+            # open window with english or german rules
+            # (fire and forget => no fds to close, no pipes, own session)
+            subprocess.Popen(self.rules_argv[self.state],
+                             executable=sys.executable, close_fds=False,
+                             start_new_session=True,
+                             stdin=subprocess.DEVNULL,
+                             stdout=subprocess.DEVNULL)
         elif self.state == CONTINUE_STATE:
             # load the config view into this window
             config_view = config.ConfigView()
@@ -380,37 +434,132 @@ class StartView(arcade.View):
         else:
             pass
 
+    def advance_title(self):
+        """
+        Execute one step of the title animation.
+
+        The title 'SHITHEAD' appears as animated sequence. We add the cards
+        face up but transparent from left to right, and fade in each card
+        within the following steps.
+        """
+        if self.title_index < self.title_len:
+            # add next card (face up, transparent) to the title
+            x, y, angle = self.title_coords[self.title_index].tolist()
+            card_sprite = CardSprite(next(self.title_cards), CARD_SCALE)
+            card_sprite.face_up()
+            card_sprite.position = (x, y)
+            card_sprite.angle = angle
+            card_sprite.alpha = 0
+            self.title.append(card_sprite)
+            self.title_index += 1
+
+        # fade in the cards added during the last steps
+        for card_sprite in self.title[self.title_fade:self.title_index]:
+            card_sprite.alpha = min(card_sprite.alpha + TITLE_FADE, 255)
+        while (self.title_fade < self.title_index
+               and self.title[self.title_fade].alpha == 255):
+            self.title_fade += 1
+
+        if self.title_fade == self.title_len:
+            self.title_done = True
+            # coords and remaining cards are not needed anymore
+            self.title_coords = None
+            self.title_cards = iter(())
+
+    def on_update(self, delta_time):
+        """
+        Update callback function.
+
+        Advances the title animation by one step per TITLE_STEP seconds,
+        independent of the frame rate.
+
+        :param delta_time:  time since last update in seconds.
+        :type delta_time:   float
+        """
+        if self.title_done:
+            return
+        self.title_time += delta_time
+        while self.title_time >= TITLE_STEP and not self.title_done:
+            self.title_time -= TITLE_STEP
+            self.advance_title()
+        self.redraw = REDRAW_FRAMES
+
+    def on_show_view(self):
+        """
+        View shown callback function.
+
+        Redraw the complete screen.
+        """
+        self.redraw = REDRAW_FRAMES
+
+    def on_hide_view(self):
+        """
+        View hidden callback function.
+
+        Restore the default update rate for the following views.
+        """
+        self.window.set_update_rate(DEFAULT_UPDATE_RATE)
+
+    def on_resize(self, width, height):
+        """
+        Window resized callback function.
+
+        Redraw the complete screen.
+
+        :param width:   new width of window.
+        :type width:    int
+        :param height:  new height of window.
+        :type height:   int
+        """
+        super().on_resize(width, height)
+        self.redraw = REDRAW_FRAMES
+
+    def on_expose(self):
+        """
+        Window exposed callback function.
+
+        The window was uncovered or restored after being minimized, i.e. the
+        buffers may have lost their contents => redraw the complete screen.
+        """
+        self.redraw = REDRAW_FRAMES
+
+    def on_activate(self):
+        """
+        Window activated callback function.
+
+        Redraw the complete screen (-> on_expose()).
+        """
+        self.redraw = REDRAW_FRAMES
+
     def on_draw(self):
         """
         Render the screen callback function.
 
         This function is called approximately 60 times per second by the game
         loop (-> arcade.run()) to redraw the screen.
+        Once the title is complete, the screen only changes when a button is
+        pressed or released or when the window is exposed or activated, i.e.
+        we skip drawing of unchanged frames.
         """
+        if self.redraw == 0:
+            # nothing changed since the last frames
+            return
+        self.redraw -= 1
+
         # clear the screen
         self.clear()
 
         # we want the 'Masters of' text to appear first
-        self.text_list[0].draw()
+        for text in self.big_text_list:
+            text.draw()
 
-        # the title 'SHITHEAD' appears as animated sequence
-        if self.title_index < self.title_len and not self.title_fup:
-            # 1st we add cards face down to the title from left to right
-            self.title.append(self.card_list.pop(0))
-            self.title_index += 1
-        elif self.title_index == self.title_len and not self.title_fup:
-            self.title_fup = True
-        elif self.title_index > 0 and self.title_fup:
-            # then we turn the cards face up from right to left
-            self.title[self.title_index - 1].face_up()
-            self.title_index -= 1
-        else:
+        if self.title_done:
             # draw buttons
             self.button_list.draw()
 
-            # draw remaining texts (including button labels)
-            for text in self.text_list:
-                text.draw()
+            # draw info text and button labels at once
+            with self.window.ctx.pyglet_rendering():
+                self.text_batch.draw()
 
         # display cards forming the 'SHITHEAD' title.
         self.title.draw()
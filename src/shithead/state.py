@@ -18,10 +18,14 @@ creating alternative game states used to simulate possible outcomes of a play.
 23.08.2022  Wolfgang Trachsler
 '''
 
-from math import comb
-from random import randrange
+from collections import OrderedDict
+from functools import lru_cache
+from math import factorial
+from random import Random, randrange
 import json
 
+import numpy as np
+
 # local imports (modules in same package)
 from .cards import Deck
 from .discard import Discard
@@ -43,6 +47,72 @@ STARTING_RANKS = ['4', '5', '6', '7', '8', '9', 'J', 'Q', 'K', 'A', '10', '2',
                   '3']
 # card suits for starting player auction from worst to best
 STARTING_SUITS = ['Clubs', 'Spades', 'Hearts', 'Diamonds']
+# (suit, rank) of every starting card code 0 => 4♣, 1 => 4♠, .., 51 => 3♢
+STARTING_CODE = tuple((STARTING_SUITS[i % 4], STARTING_RANKS[i // 4])
+                      for i in range(len(STARTING_RANKS) * 4))
+
+# direction of play symbols used in log messages
+CLOCKWISE_SYMBOL = '\u21bb'            # clockwise (open)
+COUNTERCLOCKWISE_SYMBOL = '\u21ba'     # counterclockwise (open)
+
+# seperator line for multi-line log messages
+LOG_SEPARATOR = ("------------------------------------------------------------"
+                 "------------------\n")
+
+# current/next player indicators in multi-line log messages
+LOG_INDICATORS = {
+    (True, True): 'current/next ---> ',
+    (True, False): '     current ---> ',
+    (False, True): '        next ---> ',
+    (False, False): '                  ',
+}
+
+# random generator for shuffling the unknown cards of simulation states
+SIM_RNG = np.random.default_rng()
+
+# legal game plays as (action, index) tuples per legality key
+# (-> State.get_legal_plays_key()) and maximum number of cached keys.
+# The least recently used keys are evicted first.
+LEGAL_PLAYS_CACHE = OrderedDict()
+LEGAL_PLAYS_CACHE_SIZE = 200000
+
+# random 64 bit keys per (history index, play) for the state hash.
+# The keys are created on demand with a separate random generator, i.e. the
+# card shuffling is not affected by the hash calculation.
+ZOBRIST_KEYS = {}
+ZOBRIST_RANDOM = Random(0x5e1f)
+
+
+@lru_cache(maxsize=None)
+def get_next_indices(n_players):
+    '''
+    Returns lookup tables for the next player index in both directions.
+
+    Index i in the clockwise table holds (i + 1) % n_players, index i in the
+    counterclockwise table holds (i - 1) % n_players. The tables are cached
+    per number of players (players leaving the game change the number).
+
+    :param n_players:   number of players.
+    :type n_players:    int
+    :return:            clockwise table, counterclockwise table.
+    :rtype:             tuple
+    '''
+    clockwise = tuple((idx + 1) % n_players for idx in range(n_players))
+    counterclockwise = tuple((idx - 1) % n_players for idx in range(n_players))
+    return clockwise, counterclockwise
+
+
+@lru_cache(maxsize=None)
+def get_factorial(n):
+    '''
+    Returns n! (cached, there are never more than a few hundred cards).
+
+    :param n:       non-negative integer.
+    :type n:        int
+    :return:        n!
+    :rtype:         int
+    '''
+    return factorial(n)
 
 
 class State:
@@ -85,9 +155,7 @@ class State:
         # went out), therefore we make a copy
         # NOTE: deepcopy() doesn't work in threads !!!
         # => TypeErrTypeError: cannot pickle '_thread.lock' object
-        self.players = []
-        for player in players:
-            self.players.append(player.copy())
+        self.players = [player.copy() for player in players]
 
         # get the number of players
         n_players = len(players)
@@ -150,8 +218,8 @@ class State:
 
         # list of players (index into players) still in the starting player
         # auction
-        self.auction_members = [(self.player + i) % n_players
-                                for i in range(n_players)]
+        members = list(range(n_players))
+        self.auction_members = members[self.player:] + members[:self.player]
 
         # list of players (index into players) which have shown the requested
         # card.
@@ -159,9 +227,7 @@ class State:
 
         # score and turn count per player for this round of the game
         # this is used to revert scores in case of an abort
-        self.result = {}
-        for player in self.players:
-            self.result[player.name] = [0, 0]
+        self.result = {player.name: [0, 0] for player in players}
 
         # player, action, and card causing this state
         self.log_player = None
@@ -171,8 +237,29 @@ class State:
         # log info
         self.log_info = log_info
 
-        # game history = list of plays leading up to this state
+        # width of player name column in one line logs and number of players
+        # for which it has been calculated (players only leave the game).
+        self.name_width = 0
+        self.name_width_key = -1
+
+        # game history = list of plays (-> Play.encode()) leading up to this
+        # state and flag for history list shared with copies of this state.
         self.history = []
+        self.history_shared = False
+
+        # hash of the play history and number of plays included in it
+        self.zhash = 0
+        self.zhash_len = 0
+
+        # cache for unknown and seen cards (per player name), number of
+        # unknown cards per player, bitmask of seen hand cards per player, and
+        # the history length for which they are valid (cards only move or get
+        # revealed when a play is applied).
+        self.unknown_cache = {}
+        self.seen_cache = {}
+        self.unknown_counts = None
+        self.seen_masks = None
+        self.unknown_key = -1
 
     def get_legal_swaps(self, fup, hand):
         '''
@@ -235,17 +322,13 @@ class State:
         :return:            list of legal plays ('SHOW',index or 'END',0).
         :rtype:             list
         '''
-        plays = []  # initialize empty play list
         # get the requested suit/rank
-        suit = STARTING_SUITS[starting % 4]
-        rank = STARTING_RANKS[starting // 4]
-        for index, card in enumerate(hand):
-            # check if a card matches the starting card and was not shown
-            # in a previous bidding round (same starting card is requested
-            # again if multiple players have shown it, but there are more
-            # around)
-            if card.rank == rank and card.suit == suit and not card.shown:
-                plays.append(Play('SHOW', index))
+        suit, rank = STARTING_CODE[starting]
+        # check if a card matches the starting card and was not shown in a
+        # previous bidding round (same starting card is requested again if
+        # multiple players have shown it, but there are more around)
+        plays = [Play('SHOW', index) for index, card in enumerate(hand)
+                 if card.rank == rank and card.suit == suit and not card.shown]
         plays.append(Play('END'))  # it's always possible to pass
         return plays
 
@@ -285,17 +368,19 @@ class State:
         if source == 'HAND':
             # Hand cards can always only be played if discard pile allows it.
             # it doesn't matter if it's the 1st or any other play.
+            playable = discard.get_playable_ranks(first)
             plays += [Play(source, idx)
                       for idx, card in enumerate(cards)
-                      if discard.check(first, card)]
+                      if card.rank in playable]
         elif source == 'FUP':
             if first or not plr.get_fup:
                 # 1st play, or following plays if not taken the discard pile.
                 # Face up table cards can only be played, if the discard pile
                 # allows it.
+                playable = discard.get_playable_ranks(first)
                 plays += [Play(source, idx)
                           for idx, card in enumerate(cards)
-                          if discard.check(first, card)]
+                          if card.rank in playable]
             else:
                 # 2nd, 3rd, or 4th after taking the discard pile
                 if not plr.get_fup_rank:
@@ -325,12 +410,67 @@ class State:
 
         return plays
 
+    def get_legal_plays_key(self):
+        '''
+        Get key of all state attributes which determine the legal game plays.
+
+        The legal game plays only depend on the ranks of the current player's
+        cards (only the number of face down table cards), the top of the
+        discard pile, the number of cards played this turn, the talon and the
+        discard pile being empty or not, and the player's flags for taking
+        face up table cards.
+
+        :return:    legality key
+        :rtype:     tuple
+        '''
+        discard = self.discard
+        plr = self.players[self.player]
+        source, cards = plr.get_card_source()
+        if source == 'FDOWN':
+            # face down table cards are played blindly
+            ranks = len(cards)
+        else:
+            ranks = tuple(card.rank for card in cards)
+        if plr.get_fup:
+            # face up table cards taken on hand after taking the discard pile
+            fup_ranks = tuple(card.rank for card in plr.face_up)
+        else:
+            fup_ranks = None
+        return (source, ranks, fup_ranks, plr.get_fup, plr.get_fup_rank,
+                self.n_played == 0, len(self.talon) > 0, len(discard) > 0,
+                discard.get_top_rank(), discard.get_top_non3_rank(),
+                discard.get_ntop() >= 4)
+
     def get_legal_game_plays(self):
         '''
         Get a list of legal plays for the current state of the game.
 
         Gets legal plays while actually playing the game, i.e. not while card
         swapping or starting player bidding.
+        The legal plays are cached per legality key (-> get_legal_plays_key()),
+        because many states (especially during simulations) share the same
+        configuration.
+
+        :return: list of legal plays
+        :rtype: list
+        '''
+        key = self.get_legal_plays_key()
+        plays = LEGAL_PLAYS_CACHE.get(key)
+        if plays is None:
+            plays = tuple((play.action, play.index)
+                          for play in self.find_legal_game_plays())
+            if len(LEGAL_PLAYS_CACHE) >= LEGAL_PLAYS_CACHE_SIZE:
+                # limit the memory used by the cache
+                LEGAL_PLAYS_CACHE.popitem(last=False)
+            LEGAL_PLAYS_CACHE[key] = plays
+        else:
+            # keep recently used keys in the cache
+            LEGAL_PLAYS_CACHE.move_to_end(key)
+        return [Play(action, index) for action, index in plays]
+
+    def find_legal_game_plays(self):
+        '''
+        Find the legal plays for the current state of the game.
 
         :return: list of legal plays
         :rtype: list
@@ -437,20 +577,76 @@ class State:
         hand = self.players[self.player].hand
         face_up = self.players[self.player].face_up
 
+        # NOTE: get_legal_swaps() and get_legal_bids() only read the cards
+        #       => no need to pass copies of the card lists.
         if self.game_phase == SWAPPING_CARDS:
             # get list of possible swaps
-            plays = self.get_legal_swaps([card for card in face_up],
-                                         [card for card in hand])
+            plays = self.get_legal_swaps(face_up, hand)
         elif self.game_phase == FIND_STARTER:
             # get list of possible bids (show or pass)
-            plays = self.get_legal_bids(self.starting_card,
-                                        [card for card in hand])
+            plays = self.get_legal_bids(self.starting_card, hand)
         else:   # PLAY_GAME
             # get legal game plays
             plays = self.get_legal_game_plays()
 
         return plays
 
+    def check_unknown_cache(self):
+        '''
+        Reset the cached unknown cards if a play has been applied.
+
+        The cached unknown cards and counts are only valid for the history
+        length at which they have been collected.
+        '''
+        if self.unknown_key != len(self.history):
+            # a play has been applied since the last call => reset cache
+            self.unknown_cache = {}
+            self.seen_cache = {}
+            self.unknown_counts = None
+            self.seen_masks = None
+            self.unknown_key = len(self.history)
+
+    def get_seen_masks(self):
+        '''
+        Returns bitmask of seen hand cards per player.
+
+        Bit i of a player's mask is set, if the card at index i in his hand
+        has been face up during the game. The hand cards are classified only
+        once per state (history length), all other queries work on the masks.
+
+        :return:        bitmask of seen hand cards per player.
+        :rtype:         list
+        '''
+        self.check_unknown_cache()
+        if self.seen_masks is None:
+            self.seen_masks = []
+            for player in self.players:
+                mask = 0
+                for idx, card in enumerate(player.hand):
+                    if card.seen:
+                        mask |= 1 << idx
+                self.seen_masks.append(mask)
+        return self.seen_masks
+
+    def get_unknown_counts(self):
+        '''
+        Returns number of unknown hand and face down cards per player.
+
+        The numbers are counted once per state (history length) and are then
+        reused, e.g. by calc_nof_simulation_states().
+
+        :return:        (unseen hand cards, face down cards) per player.
+        :rtype:         list
+        '''
+        masks = self.get_seen_masks()
+        if self.unknown_counts is None:
+            # unseen hand cards = hand size - number of bits set in mask
+            self.unknown_counts = [
+                (len(player.hand) - bin(mask).count('1'),
+                 len(player.face_down))
+                for player, mask in zip(self.players, masks)]
+        return self.unknown_counts
+
     def get_unknown_cards(self, name=None):
         '''
         Returns list of unknown cards.
@@ -464,14 +660,45 @@ class State:
         :return:        unknown cards.
         :rtype:         Deck
         '''
+        self.check_unknown_cache()
+        if name not in self.unknown_cache:
+            if name is None:
+                self.unknown_cache[None] = self.collect_unknown_cards()
+            else:
+                # the named player knows his own hand cards
+                # => remove them from the unknown cards of all players.
+                # Note, that this keeps the order of the sorted list.
+                own = set()
+                masks = self.get_seen_masks()
+                for player, mask in zip(self.players, masks):
+                    if player.name == name:
+                        own = {id(card) for idx, card in enumerate(player.hand)
+                               if not mask >> idx & 1}
+                self.unknown_cache[name] = [
+                    card for card in self.get_unknown_cards().deck
+                    if id(card) not in own]
+
+        # return new deck, so that the caller can't change the cache
+        unknown = Deck(empty=True)
+        unknown.deck = self.unknown_cache[name][:]
+        return unknown
+
+    def collect_unknown_cards(self):
+        '''
+        Collect all unknown cards of this state.
+
+        :return:        sorted list of unknown cards.
+        :rtype:         list
+        '''
         unknown = Deck(empty=True)
         # talon and burnt cards are unknown
         unknown += self.talon
         unknown += self.burnt
-        for player in self.players:
-            if name is None or name != player.name:
-                for card in player.hand:
-                    if not card.seen:
+        masks = self.get_seen_masks()
+        for player, mask in zip(self.players, masks):
+            if mask != (1 << len(player.hand)) - 1:
+                for idx, card in enumerate(player.hand):
+                    if not mask >> idx & 1:
                         # player's hand cards which have never been seen
                         # face up are unknown
                         unknown.add_card(card)
@@ -479,7 +706,7 @@ class State:
                 # all face down table cards are unknown
                 unknown.add_card(card)
         unknown.sort()
-        return unknown
+        return unknown.deck
 
     def get_seen_cards(self, name):
         """
@@ -495,14 +722,26 @@ class State:
         :return:        opponent hand cards which have been face up.
         :rtype:         list
         """
+        masks = self.get_seen_masks()
+        if name in self.seen_cache:
+            # already collected in this state => return a copy of the list
+            return self.seen_cache[name][:]
+
         seen_cards = []
         name_found = False
-        for player in self.players:
+        for player, mask in zip(self.players, masks):
             if player.name != name:
                 # not the current player => opponent of current player
                 if len(player.hand) > 0:
                     # player still plays from hand
-                    seen_cards += [card for card in player.hand if card.seen]
+                    if mask == (1 << len(player.hand)) - 1:
+                        # all hand cards seen (e.g. taken with the discard
+                        # pile) => no need to check them one by one.
+                        seen_cards += player.hand.deck
+                    elif mask:
+                        seen_cards += [card for idx, card
+                                       in enumerate(player.hand)
+                                       if mask >> idx & 1]
                 else:
                     # player plays face up or face down table cards
                     # NOTE the face down table cards are counted as unknown
@@ -513,6 +752,7 @@ class State:
         if not name_found:
             raise ValueError(f"{name} is not in the list of active players!")
 
+        self.seen_cache[name] = seen_cards[:]
         return seen_cards
 
     def estimate_remaining_hand(self, eff_size):
@@ -536,33 +776,87 @@ class State:
                             hand size 0.
         :rtype:             int
         '''
-        hands = []                      # list of players hand sizes
         n_talon = len(self.talon)       # number of cards in talon
         n_players = len(self.players)   # number of players
         cur = self.player               # index of current player in players
-        for player in self.players:
-            # add player's hand size to list
-            hands.append(len(player.hand))
+        # list of players hand sizes
+        hands = [len(player.hand) for player in self.players]
         # replace hand size of current player with effective size.
         hands[cur] = eff_size
         # start with the next player after the current player
         idx = (cur + 1) % n_players
-        while True:
+        while n_talon > 0:
+            if min(hands) > 0:
+                # nobody can get rid of his hand while there's a talon left
+                # => apply as many complete rounds as possible at once, i.e.
+                # till the 1st player with >3 cards is down to 3 cards or the
+                # talon doesn't suffice to refill all players with <=3 cards.
+                excess = [size - 3 for size in hands if size > 3]
+                n_refill = n_players - len(excess)
+                rounds = min(excess) if excess else n_talon
+                if n_refill > 0:
+                    rounds = min(rounds, n_talon // n_refill)
+                if rounds > 0:
+                    hands = [size - rounds if size > 3 else size
+                             for size in hands]
+                    n_talon -= rounds * n_refill
+                    continue
+            # apply a single turn
             if hands[idx] > 3:
                 # >3 cards on hand (no refill) => decrement hand size
                 hands[idx] -= 1
-            elif n_talon > 0:
-                # 3 cards on hand => decrement talon size
-                n_talon -= 1
             else:
-                # <= 3 cards on hand but no talon left => decrement hand size
-                hands[idx] -= 1
+                # <=3 cards on hand => decrement talon size
+                n_talon -= 1
             if hands[idx] <= 0:
-                break
+                return hands[cur]
             idx = (idx + 1) % n_players
 
+        # no talon left => each player decrements his hand size every turn.
+        # The player at offset i from idx gets rid of his hand with his
+        # hands[]-th turn, i.e. at turn (hands[] - 1) * n_players + i.
+        last = min((max(hands[(idx + i) % n_players], 1) - 1) * n_players + i
+                   for i in range(n_players))
+        # count the turns of the current player till then.
+        offset = (cur - idx) % n_players
+        if last >= offset:
+            hands[cur] -= (last - offset) // n_players + 1
         return hands[cur]
 
+    def get_name_width(self):
+        '''
+        Get width of the player name column in one line log messages.
+
+        The width depends on the maximum player name length to improve the
+        log formatting. Player names don't change during a game, i.e. we only
+        have to recalculate it, if a player has left the game.
+
+        :return:            width of player name column.
+        :rtype:             int
+        '''
+        if self.name_width_key != len(self.players):
+            max_name = max(len(player.name) for player in self.players)
+            if max_name > 15:
+                self.name_width = 20
+            elif max_name > 10:
+                self.name_width = 16
+            else:
+                self.name_width = 11
+            self.name_width_key = len(self.players)
+        return self.name_width
+
+    def get_direction_symbol(self):
+        '''
+        Get symbol for the direction of play next turn.
+
+        :return:            clockwise or counterclockwise symbol.
+        :rtype:             str
+        '''
+        if self.next_direction:
+            return CLOCKWISE_SYMBOL
+        else:
+            return COUNTERCLOCKWISE_SYMBOL
+
     def log_one_line(self, turn_count):
         '''
         Creates log message with one line overview over game state.
@@ -572,28 +866,12 @@ class State:
         :return:            log message.
         :rtype:             str
         '''
-        # find the maximum player name length to improve the log formatting
-        max_name = 0
-        for player in self.players:
-            if len(player.name) > max_name:
-                max_name = len(player.name)
-
         turn = f'{turn_count:>3}'
-        if self.next_direction:
-            # pdir = '\u27f3'    # clockwise (closed)
-            pdir = '\u21bb'      # clockwise (open)
-        else:
-            # pdir = '\u27f2'    # counterclockwise (closed)
-            pdir = '\u21ba'      # counterclockwise (open)
+        pdir = self.get_direction_symbol()
         talon = f'Talon:{len(self.talon):>3}'
         discard = f'Discard:{len(self.discard):>3}'
         player = f'{self.log_player}:'
-        if max_name > 15:
-            player = f'{player:<20}'
-        elif max_name > 10:
-            player = f'{player:<16}'
-        else:
-            player = f'{player:<11}'
+        player = f'{player:<{self.get_name_width()}}'
         action = f'{self.log_action:<7}'
         card = f'{self.log_card:<3}'
         # add turn count, direction, talon size, player name, action, card
@@ -604,52 +882,76 @@ class State:
         log_msg += self.discard.get_top_string()
         return log_msg
 
-    def log_no_secrets(self, turn_count):
+    def log_multi_line(self, turn_count, reveal):
         '''
-        Creates log message with game overview and everything disclosed.
+        Creates multi-line log message with game overview.
+
+        The amount of disclosed information is selected with the reveal level:
+            0 => all information visible to the human player.
+            1 => also reveal AI hand cards which have been face up.
+            3 => everything disclosed (talon and all hand cards).
 
         :param turn_count:  number of current turn.
         :type turn_count:   int
+        :param reveal:      reveal level (0, 1, or 3).
+        :type reveal:       int
+        :return:            log message
+        :rtype:             str
         '''
         # add turn count, direction, player name, action, and played card
-        log_msg = f'Turn:    {turn_count:>3}   '
-        if self.next_direction:
-            log_msg += '\u21bb   '
-        else:
-            log_msg += '\u21ba   '
-        log_msg += f'{self.log_player}: {self.log_action} {self.log_card}\n'
+        log_msg = f'Turn:    {turn_count:>3}   {self.get_direction_symbol()}'
+        log_msg += f'   {self.log_player}: {self.log_action} {self.log_card}\n'
 
-        # add unknown cards size and unknown cards to string
         unknown = self.get_unknown_cards()
-        log_msg += f'Unknown: {len(unknown):>3}   '
-        log_msg += unknown.get_string() + '\n'
-
-        # add talon size and talon cards to string
-        log_msg += f'Talon:   {len(self.talon):>3}   '
-        log_msg += self.talon.get_string() + '\n'
-
-        # add discard size and discard pile cards to string
-        log_msg += f'Discard: {len(self.discard):>3}   '
-        log_msg += self.discard.get_top_string(None, True) + '\n'
+        if reveal == 3:
+            # add unknown cards size and unknown cards to string
+            log_msg += f'Unknown: {len(unknown):>3}   '
+            log_msg += unknown.get_string() + '\n'
+            # add talon size and talon cards to string
+            log_msg += f'Talon:   {len(self.talon):>3}   '
+            log_msg += self.talon.get_string() + '\n'
+            # add discard size and discard pile cards to string
+            log_msg += f'Discard: {len(self.discard):>3}   '
+            log_msg += self.discard.get_top_string(None, True) + '\n'
+        else:
+            # add unknown cards size, talon size, discard pile size,
+            # and top discard pile cards.
+            log_msg += f'Unknown: {len(unknown):>3}   '
+            log_msg += f'Talon:   {len(self.talon):>3}   '
+            log_msg += f'Discard: {len(self.discard):>3}   '
+            log_msg += self.discard.get_top_string() + '\n'
 
         # add one line per player to the string
         cur = self.players[self.player]
         nxt = self.players[self.next_player]
         for player in self.players:
             # add current/next indicator
-            if player == cur and player == nxt:
-                log_msg += 'current/next ---> '
-            elif player == cur:
-                log_msg += '     current ---> '
-            elif player == nxt:
-                log_msg += '        next ---> '
-            else:
-                log_msg += '                  '
+            log_msg += LOG_INDICATORS[(player == cur, player == nxt)]
             # add player's name, facedown, faceup, and hand cards to string
-            log_msg += player.get_string(None, 3) + '\n'
+            if reveal == 3:
+                # reveal all cards
+                log_msg += player.get_string(None, 3)
+            elif player.is_human:
+                # reveal human player's hand cards
+                log_msg += player.get_string(None, 2)
+            else:
+                # AI player cards (1 => reveal seen hand cards)
+                log_msg += player.get_string(None, reveal)
+            log_msg += '\n'
 
         return log_msg
 
+    def log_no_secrets(self, turn_count):
+        '''
+        Creates log message with game overview and everything disclosed.
+
+        :param turn_count:  number of current turn.
+        :type turn_count:   int
+        :return:            log message
+        :rtype:             str
+        '''
+        return self.log_multi_line(turn_count, 3)
+
     def log_game_display(self, turn_count, remember=False):
         '''
         Creates log message with all information visible to the human player.
@@ -661,48 +963,10 @@ class State:
         :return:            log message
         :rtype:             str
         '''
-        # add turn count, direction, player name, action, and played card
-        log_msg = f'Turn:    {turn_count:>3}   '
-        if self.next_direction:
-            log_msg += '\u21bb   '
+        if remember:
+            return self.log_multi_line(turn_count, 1)
         else:
-            log_msg += '\u21ba   '
-        log_msg += f'{self.log_player}: {self.log_action} {self.log_card}\n'
-
-        # add unknown cards size, talon size, discard pile size,
-        # and top discard pile cards.
-        unknown = self.get_unknown_cards()
-        log_msg += f'Unknown: {len(unknown):>3}   '
-        log_msg += f'Talon:   {len(self.talon):>3}   '
-        log_msg += f'Discard: {len(self.discard):>3}   '
-        log_msg += self.discard.get_top_string() + '\n'
-
-        # add one line per player to the string
-        cur = self.players[self.player]
-        nxt = self.players[self.next_player]
-        for player in self.players:
-            # add current/next indicator
-            if player == cur and player == nxt:
-                log_msg += 'current/next ---> '
-            elif player == cur:
-                log_msg += '     current ---> '
-            elif player == nxt:
-                log_msg += '        next ---> '
-            else:
-                log_msg += '                  '
-            # add player's name, facedown, faceup, and hand cards to string
-            if player.is_human:
-                # reveal human player's hand cards
-                log_msg += player.get_string(None, 2)
-            else:
-                # AI player cards
-                if remember:    # reveal seen hand cards
-                    log_msg += player.get_string(None, 1)
-                else:           # don't reveal hand cards
-                    log_msg += player.get_string(None, 0)
-            log_msg += '\n'
-
-        return log_msg
+            return self.log_multi_line(turn_count, 0)
 
     def log_debugging(self):
         '''
@@ -743,10 +1007,11 @@ class State:
         log_dict['shown_starting_card'] = self.shown_starting_card
         log_dict['result'] = self.result
         log_dict['log_info'] = self.log_info
-        log_dict['history'] = self.history
+        log_dict['history'] = [str(Play.decode(code))
+                               for code in self.history]
 
-        # create the JSON string
-        json_str = json.dumps(log_dict)
+        # create the JSON string (without whitespace after separators)
+        json_str = json.dumps(log_dict, separators=(',', ':'))
         return json_str
 
     def print(self):
@@ -768,8 +1033,7 @@ class State:
             turn_count = 0
 
         # seperator line for multi-line logs
-        sep = ("--------------------------------------------------------------"
-               "----------------\n")
+        sep = LOG_SEPARATOR
 
         # get the log_level from log_info
         log_level = self.log_info[0]
@@ -794,8 +1058,9 @@ class State:
         print(log_msg)
 
         if self.log_info[1]:        # log-to-file selected
-            if self.log_info[2]:    # log debugging to file
+            if self.log_info[2] and log_level != 'Debugging':
                 # log JSON string of info for game state reconstruction
+                # (already created if it's also the terminal log-level)
                 log_msg = sep + self.log_debugging()
 
             with open(self.log_info[3], 'a', encoding='utf-8') as log_file:
@@ -803,17 +1068,47 @@ class State:
 
     def hash(self):
         '''
-        Hash key unambiguously identifying this state.
+        Hash key identifying this state.
+
+        Each state is identified by the play history leading up to this
+        state. Instead of concatenating the string representations of
+        all plays in the history (which gets slow for long histories), we use
+        a Zobrist hash: each (history index, play) pair gets a random 64 bit
+        key and the hash is the XOR of the keys of all plays in the history.
+        Including the index makes sure that repeated plays (e.g. 'END') don't
+        cancel each other out.
+        The hash is updated incrementally with the plays added to the history
+        since the last call.
+
+        :return:    hash identifying this state (different histories may
+                    collide, but it's very unlikely with 64 bit keys).
+        :rtype:     int
+        '''
+        history = self.history
+        for idx in range(self.zhash_len, len(history)):
+            key = (idx, history[idx])
+            zkey = ZOBRIST_KEYS.get(key)
+            if zkey is None:
+                # 1st occurence of this play at this index => create a key
+                zkey = ZOBRIST_KEYS.setdefault(
+                    key, ZOBRIST_RANDOM.getrandbits(64))
+            self.zhash ^= zkey
+        self.zhash_len = len(history)
+        return self.zhash
 
-        Each state is unambiguously identified by the play history leading up
-        to this state. We create a hash by concatinating the string
-        representations of the plays in the play history of this state to a
-        single string.
+    @classmethod
+    def blank(cls):
+        '''
+        Create a bare state object without initializing it.
+
+        Alternative constructor for copy(), which skips __init__(), i.e. no
+        talon with n_decks, no empty piles, auction members, and results are
+        created. All attributes have to be set by the caller.
 
-        :return:    hash unambiguously identifying this state.
-        :rtype:     str
+        :return:        uninitialized shithead state.
+        :rtype:         State
         '''
-        return ''.join(self.history)
+        return cls.__new__(cls)
 
     def copy(self):
         '''
@@ -822,19 +1117,20 @@ class State:
         :return:        copy of shithead state (not just reference).
         :rtype:         State
         '''
-        # create a new state for the current list of players
-        new_state = State(self.players, self.dealer, self.n_decks,
-                          self.log_info)
+        # create a bare state without talon and piles, which we would throw
+        # away anyway.
+        new_state = State.blank()
 
-        # but this creates a talon containing n_decks
-        # => we have to replace it with the original talon
+        # make copies of players and card piles
+        # NOTE: deepcopy() doesn't work in threads !!!
+        new_state.players = [player.copy() for player in self.players]
         new_state.talon = self.talon.copy()
-
-        # overwrite the attributes of the new state with copies from the
-        # current state.
         new_state.discard = self.discard.copy()
         new_state.burnt = self.burnt.copy()
         new_state.killed = self.killed.copy()
+        new_state.n_decks = self.n_decks
+        new_state.n_burnt = self.n_burnt
+        new_state.dealer = self.dealer
         new_state.player = self.player
         new_state.next_player = self.next_player
         new_state.direction = self.direction
@@ -848,16 +1144,46 @@ class State:
         new_state.auction_members = self.auction_members[:]
         new_state.shown_starting_card = self.shown_starting_card[:]
         # score and turn count per player for this round of the game
-        new_state.result = {}
-        for key, val in self.result.items():
-            new_state.result[key] = val
+        new_state.result = dict(self.result)
+        # player, action, and card causing this state
+        new_state.log_player = self.log_player
+        new_state.log_action = self.log_action
+        new_state.log_card = self.log_card
         # copy the log info
         new_state.log_info = self.log_info
-        # copy the play history
-        new_state.history = self.history[:]
+        new_state.name_width = self.name_width
+        new_state.name_width_key = self.name_width_key
+        # share the play history until one of the states adds a play
+        # (-> record()), and copy its hash
+        new_state.history = self.history
+        new_state.history_shared = True
+        self.history_shared = True
+        new_state.zhash = self.zhash
+        new_state.zhash_len = self.zhash_len
+        # the cache of unknown cards is not copied (it's rebuilt on demand)
+        new_state.unknown_cache = {}
+        new_state.seen_cache = {}
+        new_state.unknown_counts = None
+        new_state.seen_masks = None
+        new_state.unknown_key = -1
         # finally return the copy of the state
         return new_state
 
+    def record(self, code):
+        '''
+        Add play to the play history of this state.
+
+        Copies of a state share the history list with the original state.
+        The list is only copied, when a play is added to a shared history.
+
+        :param code:    play encoded as int (-> Play.encode()).
+        :type code:     int
+        '''
+        if self.history_shared:
+            self.history = self.history[:]
+            self.history_shared = False
+        self.history.append(code)
+
     def is_player(self, name):
         """
         Check if current player has specified name.
@@ -867,10 +1193,7 @@ class State:
         :return:            True if current player is named player.
         :rtype:             bool
         """
-        if self.players[self.player].name == name:
-            return True
-        else:
-            return False
+        return self.players[self.player].name == name
 
     @classmethod
     def simulation_state(cls, state, sim_player=None):
@@ -899,51 +1222,74 @@ class State:
         '''
         # simulation states starts out as copy of the original state
         sim = state.copy()
+        # simulated plays must never be written to the game's log-file
+        # (only printed if the simulation is debugged verbosely).
+        sim.log_info = (sim.log_info[0], False, False, '')
 
-        # remember number of burnt cards in original game
+        # collect all unknown cards in one pool, starting with the talon and
+        # the burnt cards (in the order they would be popped from the pile).
+        pool = sim.talon.deck
         n_burnt = len(sim.burnt)
-        # remove cards from burnt cards and put them back to the talon
-        for _ in range(n_burnt):
-            sim.talon.add_card(sim.burnt.pop_card())
+        pool += sim.burnt.deck[::-1]
 
         # the simulated player is different, he knows all his hand cards.
         if sim_player is None:
             # current player is simulated player by default
-            sim_player = sim.players[sim.player].name
-        n_players = {}
-        for player in sim.players:
-            # put unknown cards from player's hand back to talon
+            sim_idx = sim.player
+        else:
+            # find index of simulated player (-1 => not an active player)
+            sim_idx = -1
+            for idx, player in enumerate(sim.players):
+                if player.name == sim_player:
+                    sim_idx = idx
+                    break
+        # number of cards removed from hand and table (index as in players)
+        n_players = [None] * len(sim.players)
+        for idx, player in enumerate(sim.players):
+            # put unknown cards from player's hand into the pool
             n_hand = 0
-            if player.name != sim_player:   # not the simulated player
-                # make a list of unkown cards in this player's hand
+            if idx != sim_idx:   # not the simulated player
                 unknown = [card for card in player.hand if not card.seen]
-                n_hand = len(unknown)
-                for card in unknown:
-                    sim.talon.add_card(player.remove_card('HAND', card))
-
-            # put player's face down table cards back to talon
-            unknown = [card for card in player.face_down]
-            n_fdown = len(unknown)
-            for card in unknown:
-                sim.talon.add_card(player.remove_card('FDOWN', card))
+                if unknown:
+                    n_hand = len(unknown)
+                    pool += unknown
+                    player.hand.deck = [card for card in player.hand
+                                        if card.seen]
+
+            # put player's face down table cards into the pool
+            n_fdown = len(player.face_down)
+            pool += player.face_down.deck
+            player.face_down.deck = []
             # remember number of cards removed from hand and table
-            n_players[player.name] = [n_hand, n_fdown]
+            n_players[idx] = (n_hand, n_fdown)
 
-        # shuffle talon and redistribute the cards
-        sim.talon.shuffle()
+        # shuffle the pool (i.e. the talon) by reordering the cards with a
+        # random permutation of their indices (much faster than shuffling the
+        # list of card objects) and redistribute the cards, taking them from
+        # the top of the pool.
+        order = SIM_RNG.permutation(len(pool)).tolist()
+        pool[:] = [pool[idx] for idx in order]
+        end = len(pool)
 
-        # remove burnt cards from talon
-        for _ in range(n_burnt):
-            sim.burnt.add_card(sim.talon.pop_card())
+        # remove burnt cards from the pool
+        sim.burnt.deck = pool[end - n_burnt:end][::-1]
+        end -= n_burnt
 
         # refill hand and facedown table cards of players
-        for player in sim.players:
-            # refill hand with n_hand cards
-            for _ in range(n_players[player.name][0]):
-                player.take_card('HAND', sim.talon.pop_card())
+        for player, (n_hand, n_fdown) in zip(sim.players, n_players):
+            if n_hand:
+                # refill hand with n_hand cards
+                player.hand.deck += pool[end - n_hand:end][::-1]
+                player.hand.sort()  # always keep hand sorted
+                end -= n_hand
             # refill face down table cards with n_fdown cards
-            for _ in range(n_players[player.name][1]):
-                player.take_card('FDOWN', sim.talon.pop_card())
+            player.face_down.deck = pool[end - n_fdown:end][::-1]
+            end -= n_fdown
+
+        # the remaining cards form the talon
+        del pool[end:]
+        # cards have been redistributed without a play => invalidate cache
+        sim.unknown_key = -1
         return sim
 
     @classmethod
@@ -967,6 +1313,13 @@ class State:
         The total number of possible redistributions is the product
           n_sim_states = n_hands1 * n_fdowns1 * n_hands2 * n_fdowns2 * ...
 
+        which is the multinomial coefficient
+          n_sim_states = uk_tot! / (uk_hand1! * uk_fdown1! * ... * uk_rest!)
+
+        with uk_rest = uk_tot - uk_hand1 - uk_fdown1 - ... (the burnt cards).
+        We calculate it from cached factorials instead of a chain of
+        binomial coefficients.
+
         :param state:   original shithead game state.
         :type state:    State
         :return:        number of different simulation states.
@@ -978,26 +1331,18 @@ class State:
         uk_pl = []
 
         # the current player is different, he knows all his hand cards.
-        current_player = state.players[state.player]
-        for player in state.players:
-            # count players unknown hand cards
-            uk_hand = 0
-            if player != current_player:
-                for card in player.hand:
-                    if not card.seen:
-                        uk_hand += 1
-            uk_tot += uk_hand
+        for idx, (uk_hand, uk_fdown) in enumerate(state.get_unknown_counts()):
+            if idx == state.player:
+                uk_hand = 0
+            uk_tot += uk_hand + uk_fdown
             uk_pl.append(uk_hand)
-
-            # count player's face down table cards
-            uk_fdown = len(player.face_down)
-            uk_tot += uk_fdown
             uk_pl.append(uk_fdown)
 
         # calculate the number of possible redistributions
-        n_sim_states = 1    # all player cards known
+        n_sim_states = get_factorial(uk_tot)
         for uk in uk_pl:
-            n_sim_states *= comb(uk_tot, uk)
+            n_sim_states //= get_factorial(uk)
             uk_tot -= uk
+        n_sim_states //= get_factorial(uk_tot)
 
         return n_sim_states
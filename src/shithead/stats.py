@@ -15,7 +15,6 @@ player ended as shithead.
 31.08.2022  Wolfgang Trachsler
 '''
 
-from collections import defaultdict
 import json
 
 SH_COUNT = 0    # number of times player was shithead
@@ -23,30 +22,51 @@ SCORE = 1       # total score
 GAMES = 2       # number of games played
 TURNS = 3       # total number of turns played
 
+# lines of the human readable statistic table (-> get_lines())
+TABLE_TOP = ("+--------------------+--------------------+----------"
+             "+----------+----------+------------+")
+TABLE_HEADER = ("| Player             |       Shithead     |    Score"
+                " |    Games |    Turns | Turns/Game |")
+TABLE_SEPARATOR = ("+--------------------+-----------+--------+----------"
+                   "+----------+----------+------------+")
+# format of player rows and totals row
+TABLE_ROW = "| {:<19}|{:>10} |{:>6.1f}% |{:>9} |{:>9} |{:>9} |{:>11.2f} |"
+
 
 class Statistics():
     """
     Statistics class for shithead game.
     """
 
-    def default_val(self):
-        '''
-        Creates default value for table entry.
-
-        :return:    shit count = 0, total score = 0, number of games = 0,
-                    number of turns = 0
-        :rtype:     list
-        '''
-        return [0, 0, 0, 0]
-
     def __init__(self):
         '''
         initialize the game statistics.
         '''
-        # table returns all-0 if key is not in dictionary
-        self.table = defaultdict(self.default_val)
+        # statistic counters per player name
+        self.table = {}
         # name of last Shithead => dealer of next game
         self.shithead = None
+        # sorted rows and totals (-> get_rows()), None => not yet calculated
+        self.rows = None
+
+    def get_row(self, name):
+        '''
+        Get the statistic counters of the specified player.
+
+        If the player is not yet in the statistics, an entry with all counters
+        set to 0 is added.
+
+        :param name:    name of player.
+        :type name:     str
+        :return:        shit_count, score, games, turns
+        :rtype:         list
+        '''
+        row = self.table.get(name)
+        if row is None:
+            # new player => all counters 0
+            row = [0, 0, 0, 0]
+            self.table[name] = row
+        return row
 
     def update(self, name, score, turns):
         '''
@@ -62,14 +82,16 @@ class Statistics():
         :type turns:    int
         '''
         # add score to statistic table entry for this player.
-        self.table[name][SCORE] += score   # total score
-        self.table[name][TURNS] += turns   # total number of turns
-        self.table[name][GAMES] += 1       # number of games played
+        row = self.get_row(name)
+        row[SCORE] += score     # total score
+        row[TURNS] += turns     # total number of turns
+        row[GAMES] += 1         # number of games played
 
         # a score of 0 means the player was shithead
         if score == 0:
-            self.table[name][SH_COUNT] += 1  # increment the shit count
+            row[SH_COUNT] += 1  # increment the shit count
             self.shithead = name
+        self.rows = None    # sorted rows have to be recalculated
 
     def set_stats(self, name, counters):
         '''
@@ -83,10 +105,12 @@ class Statistics():
         :param counters:    shit_count, score, games, turns
         :type counters:     list
         '''
-        self.table[name][SH_COUNT] = counters[SH_COUNT]
-        self.table[name][SCORE] = counters[SCORE]
-        self.table[name][GAMES] = counters[GAMES]
-        self.table[name][TURNS] = counters[TURNS]
+        row = self.get_row(name)
+        row[SH_COUNT] = counters[SH_COUNT]
+        row[SCORE] = counters[SCORE]
+        row[GAMES] = counters[GAMES]
+        row[TURNS] = counters[TURNS]
+        self.rows = None    # sorted rows have to be recalculated
 
     def revert(self, name, score, turns):
         '''
@@ -108,27 +132,47 @@ class Statistics():
         :param turns:   number of turns played this game.
         :type turns:    int
         '''
-        self.table[name][SCORE] -= score   # total score
-        self.table[name][TURNS] -= turns   # total number of turns
-        self.table[name][GAMES] -= 1       # number of games played
+        row = self.get_row(name)
+        row[SCORE] -= score     # total score
+        row[TURNS] -= turns     # total number of turns
+        row[GAMES] -= 1         # number of games played
+        self.rows = None    # sorted rows have to be recalculated
 
     def get_stats(self, name):
         '''
         Get the statistic counters for the specified player.
 
+        A player who is not in the statistics gets all counters 0 (without
+        adding him to the statistics).
+
         :param name:    name of player.
         :type name:     str
         :return:        shit_count, score, games, turns
         :rtype:         tuple
         '''
-        return (self.table[name][SH_COUNT], self.table[name][SCORE],
-                self.table[name][GAMES], self.table[name][TURNS])
+        row = self.table.get(name)
+        if row is None:
+            return (0, 0, 0, 0)
+        return (row[SH_COUNT], row[SCORE], row[GAMES], row[TURNS])
 
-    def get_table(self):
+    def get_rows(self):
         """
-        Returns a sorted list of statistics.
+        Get sorted statistic rows with derived values and totals.
+
+        The rows are sorted by shit count and contain the percentage of games
+        lost and the average number of turns per game. They are only
+        recalculated if the statistics have changed since the last call, i.e.
+        repeatedly displaying the ranking doesn't sort the table again.
+
+        :return:    rows (name, shit count, shit percentage, score, games,
+                    turns, turns per game) and totals (number of players,
+                    followed by the same columns).
+        :rtype:     tuple
         """
-        table = []
+        if self.rows is not None:
+            return self.rows
+
+        rows = []
         total_sh_count = 0
         total_sh_percent = 0
         total_score = 0
@@ -139,25 +183,43 @@ class Statistics():
         # by value (x[1]) in normal order.
         sorted_table = sorted(self.table.items(), key=lambda x: x[1][SH_COUNT],
                               reverse=False)
-        for name, value in sorted_table:
+        # the counters are unpacked once per row
+        # (same order as SH_COUNT, SCORE, GAMES, TURNS).
+        for name, (sh_count, score, games, turns) in sorted_table:
             sh_percent = 0
             avg_turns = 0
-            if value[GAMES] > 0:
-                sh_percent = value[SH_COUNT] / value[GAMES] * 100
-                avg_turns = value[TURNS] / value[GAMES]
-            entry = [name, f'{value[SH_COUNT]}', f'{sh_percent:.1f}%',
-                     f'{value[SCORE]}', f'{value[GAMES]}', f'{value[TURNS]}',
-                     f'{avg_turns:.1f}']
-            table.append(entry)
-            total_sh_count += value[SH_COUNT]
+            if games > 0:
+                sh_percent = sh_count / games * 100
+                avg_turns = turns / games
+            rows.append((name, sh_count, sh_percent, score, games, turns,
+                         avg_turns))
+            total_sh_count += sh_count
             total_sh_percent += sh_percent
-            total_score += value[SCORE]
-            total_games = value[GAMES]  # don't sum up
-            total_turns += value[TURNS]
+            total_score += score
+            total_games = games     # don't sum up
+            total_turns += turns
         if total_games > 0:
             total_avg_turns = total_turns / total_games
+        totals = (len(rows), total_sh_count, total_sh_percent, total_score,
+                  total_games, total_turns, total_avg_turns)
+        self.rows = (rows, totals)
+        return self.rows
+
+    def get_table(self):
+        """
+        Returns a sorted list of statistics.
+        """
+        rows, totals = self.get_rows()
+        table = []
+        for (name, sh_count, sh_percent, score, games, turns,
+             avg_turns) in rows:
+            entry = [name, f'{sh_count}', f'{sh_percent:.1f}%', f'{score}',
+                     f'{games}', f'{turns}', f'{avg_turns:.1f}']
+            table.append(entry)
         # add entry with totals
-        entry = [f'{len(sorted_table)}', f'{total_sh_count}',
+        (n_players, total_sh_count, total_sh_percent, total_score,
+         total_games, total_turns, total_avg_turns) = totals
+        entry = [f'{n_players}', f'{total_sh_count}',
                  f'{total_sh_percent:.1f}%', f'{total_score}',
                  f'{total_games}', f'{total_turns}', f'{total_avg_turns:.1f}']
         table.append(entry)
@@ -176,11 +238,14 @@ class Statistics():
         '''
         Write statistics table to json file.
 
+        The file is only read by load(), the human readable table is written
+        by write_to_file() => no indentation.
+
         :param filename:    name of json file.
         :type filename:     str
         '''
         with open(filename, 'w', encoding='utf-8') as json_file:
-            json.dump(self.table, json_file, indent=4)
+            json.dump(self.table, json_file, separators=(',', ':'))
 
     def load(self, filename):
         '''
@@ -194,58 +259,38 @@ class Statistics():
         '''
         try:
             with open(filename, 'r', encoding='utf-8') as json_file:
-                _table = json.load(json_file)
-                self.table = defaultdict(self.default_val, _table)
+                self.table = json.load(json_file)
+                self.rows = None
         except OSError as err:
             print(err)
             print(f"### Warning: couldn't load file {filename},"
                   " continue with empty statistic")
-            self.table = defaultdict(self.default_val)
+            self.table = {}
+            self.rows = None
+
+    def get_lines(self):
+        '''
+        Get the lines of the human readable statistic table.
+
+        Used for printing the statistic to the terminal and for writing it to
+        a file.
+
+        :return:    lines of statistic table (without newline).
+        :rtype:     list
+        '''
+        rows, totals = self.get_rows()
+        lines = [TABLE_TOP, TABLE_HEADER, TABLE_SEPARATOR]
+        lines += [TABLE_ROW.format(*row) for row in rows]
+        lines.append(TABLE_SEPARATOR)
+        lines.append(TABLE_ROW.format(*totals))
+        lines.append(TABLE_SEPARATOR)
+        return lines
 
     def print(self):
         '''
         Print sorted statistic.
         '''
-        # sort the list of table items (= key,value tuples)
-        # by value (x[1]) in normal order.
-        sorted_table = sorted(self.table.items(), key=lambda x: x[1][SH_COUNT],
-                              reverse=False)
-        total_games = 0
-        total_score = 0
-        total_turns = 0
-        total_sh_count = 0
-        total_sh_percent = 0
-        total_avg_turns = 0
-        print("+--------------------+--------------------+----------+---------"
-              "-+----------+------------+")
-        print("| Player             |       Shithead     |    Score |    Games"
-              " |    Turns | Turns/Game |")
-        print("+--------------------+-----------+--------+----------+---------"
-              "-+----------+------------+")
-        for name, value in sorted_table:
-            sh_percent = 0
-            avg_turns = 0
-            if value[GAMES] > 0:
-                sh_percent = value[SH_COUNT] / value[GAMES] * 100
-                avg_turns = value[TURNS] / value[GAMES]
-            print(f"| {name:<19}|{value[SH_COUNT]:>10} |{sh_percent:>6.1f}%"
-                  f" |{value[SCORE]:>9} |{value[GAMES]:>9} |{value[TURNS]:>9}"
-                  f" |{avg_turns:11.2f} |")
-            total_games = value[GAMES]  # don't sum up
-            total_score += value[SCORE]
-            total_turns += value[TURNS]
-            total_sh_count += value[SH_COUNT]
-            total_sh_percent += sh_percent
-        if total_games > 0:
-            total_avg_turns = total_turns / total_games
-        print("+--------------------+-----------+--------+----------+---------"
-              "-+----------+------------+")
-        print(f"| {len(sorted_table):<19}|{total_sh_count:>10}"
-              f" |{total_sh_percent:>6.1f}% |{total_score:>9}"
-              f" |{total_games:>9} |{total_turns:>9}"
-              f" |{total_avg_turns:>11.2f} |")
-        print("+--------------------+-----------+--------+----------+---------"
-              "-+----------+------------+")
+        print('\n'.join(self.get_lines()))
         print()
 
     def write_to_file(self, filename):
@@ -255,49 +300,9 @@ class Statistics():
         :param filename:    name of file.
         :type filename:     str
         '''
-        # sort the list of table items (= key,value tuples)
-        # by value (x[1]) in normal order.
-        sorted_table = sorted(self.table.items(), key=lambda x: x[1][SH_COUNT],
-                              reverse=False)
-        total_games = 0
-        total_score = 0
-        total_turns = 0
-        total_sh_count = 0
-        total_sh_percent = 0
-        total_avg_turns = 0
         # write sorted table to file
         with open(filename, 'w', encoding='utf-8') as f:
-            f.write("+--------------------+--------------------+----------+---"
-                    "-------+----------+------------+\n")
-            f.write("| Player             |       Shithead     |    Score |   "
-                    " Games |    Turns | Turns/Game |\n")
-            f.write("+--------------------+-----------+--------+----------+---"
-                    "-------+----------+------------+\n")
-            for name, value in sorted_table:
-                sh_percent = 0
-                avg_turns = 0
-                if value[GAMES] > 0:
-                    sh_percent = value[SH_COUNT] / value[GAMES] * 100
-                    avg_turns = value[TURNS] / value[GAMES]
-                f.write(f"| {name:<19}|{value[SH_COUNT]:>10}"
-                        f" |{sh_percent:>6.1f}% |{value[SCORE]:>9}"
-                        f" |{value[GAMES]:>9} |{value[TURNS]:>9}"
-                        f" |{avg_turns:11.2f} |\n")
-                total_games = value[GAMES]  # don't sum up
-                total_score += value[SCORE]
-                total_turns += value[TURNS]
-                total_sh_count += value[SH_COUNT]
-                total_sh_percent += sh_percent
-            if total_games > 0:
-                total_avg_turns = total_turns / total_games
-            f.write("+--------------------+-----------+--------+----------+---"
-                    "-------+----------+------------+\n")
-            f.write(f"| {len(sorted_table):<19}|{total_sh_count:>10}"
-                    f" |{total_sh_percent:>6.1f}% |{total_score:>9}"
-                    f" |{total_games:>9} |{total_turns:>9}"
-                    f" |{total_avg_turns:>11.2f} |\n")
-            f.write("+--------------------+-----------+--------+----------+---"
-                    "-------+----------+------------+\n")
+            f.write(''.join(line + '\n' for line in self.get_lines()))
 
 
 if __name__ == '__main__':